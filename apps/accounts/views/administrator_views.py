@@ -12,6 +12,7 @@ from apps.accounts.utils import (
 )
 from apps.accounts.models import Administrator, ClientRequest
 from apps.accounts.serializers import ClientRequestSerializer
+from apps.core.pagination import KeysetPagination
 
 
 class AdministratorLoginAPIView(APIView):
@@ -47,9 +48,10 @@ class ClientRequestListAPIView(APIView):
     authentication_classes = [AdminJWTAuthentication]
 
     def get(self, request):
-        requests = ClientRequest.objects.all().order_by("-created_at")
-        serializer = ClientRequestSerializer(requests, many=True)
-        return Response(serializer.data, status=200)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(ClientRequest.objects.all(), request, view=self)
+        serializer = ClientRequestSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class ApproveClientRequestAPIView(APIView):
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AdministratorsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.administrators'
+
+    def ready(self):
+        import apps.administrators.counters
+        import apps.administrators.signals
@@ -0,0 +1,44 @@
+"""
+Native async login view. ASGI (hrm/asgi.py) par serve ho to password hash
+ke dauran event loop free rehta hai; hashing PasswordHashingService pool par hoti hai.
+"""
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.core.hashing import HashingServiceBusy
+from apps.core.last_seen import last_seen_buffer
+from apps.core.http import error_response, parse_json_body, throttled_response
+from apps.core.throttling import get_client_ip, login_throttle
+from .models import Administrator
+from .utils import aauthenticate_admin_with_email_or_username, get_tokens_for_administrator
+
+
+@csrf_exempt
+@require_POST
+async def administrator_login_async(request):
+    data = parse_json_body(request)
+    if data is None:
+        return error_response("Invalid JSON body", 400)
+
+    identifier = data.get("email_or_username")
+    password = data.get("password")
+    if not identifier or not password:
+        return error_response("Email/username and password required", 400)
+
+    wait = login_throttle.check("admin-login", get_client_ip(request), identifier)
+    if wait is not None:
+        return throttled_response(wait)
+
+    try:
+        user = await aauthenticate_admin_with_email_or_username(identifier, password)
+    except HashingServiceBusy as exc:
+        return error_response(str(exc.detail), exc.status_code)
+
+    if not user:
+        return error_response("Invalid credentials", 401)
+
+    last_seen_buffer.record(Administrator, user.pk, "last_time")
+
+    tokens = get_tokens_for_administrator(user)
+    return JsonResponse({"message": "Admin login successful", "tokens": tokens})
@@ -1,20 +1,39 @@
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework import exceptions
+from apps.core.principal import Principal, attach_principal, check_token_version
+from apps.core.principal_cache import principal_cache
+from apps.core.token_cache import CachedTokenValidationMixin
 from .models import Administrator
 
-class AdminJWTAuthentication(JWTAuthentication):
+class AdminJWTAuthentication(CachedTokenValidationMixin, JWTAuthentication):
      
 
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is None:
+            return None
+
+        admin, validated_token = result
+        attach_principal(request, Principal.ADMINISTRATOR, admin, validated_token)
+        return result
+
     def get_user(self, validated_token):
         admin_id = validated_token.get("admin_id")
         if not admin_id:
             raise exceptions.AuthenticationFailed("Admin ID missing in token")
 
         try:
-            admin = Administrator.objects.get(id=admin_id, is_active=True)
+            admin = principal_cache.get_or_load(
+                "administrator",
+                admin_id,
+                lambda: Administrator.objects.get(id=admin_id, is_active=True),
+            )
         except Administrator.DoesNotExist:
             raise exceptions.AuthenticationFailed("Administrator not found or inactive")
 
+        if not check_token_version(admin, validated_token):
+            raise exceptions.AuthenticationFailed("Token is no longer valid")
+
         # Add is_authenticated property to satisfy DRF
         admin.is_authenticated = True
         return admin
@@ -0,0 +1,9 @@
+from apps.core.counters import register_counter
+
+from .models import Administrator
+
+TOTAL_ADMINS = "administrators.total"
+ACTIVE_ADMINS = "administrators.active"
+
+register_counter(TOTAL_ADMINS, lambda: Administrator.objects.all())
+register_counter(ACTIVE_ADMINS, lambda: Administrator.objects.filter(is_active=True))
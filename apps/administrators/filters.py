@@ -0,0 +1,66 @@
+"""
+Admin client-request list / export ke server-side filters.
+
+    ?status=pending,approved   ?industry_type=IT   ?company_size=11-50
+    ?created_after=2026-01-01  ?created_before=2026-02-01T00:00:00Z
+    ?search=acme               (client company_name / company_email)
+
+Har filter ke peeche index hai (clients migration 0006): status / industry
+composite (-created_at, -id) ke saath taake keyset order bhi index se aaye,
+pending ke liye partial index, aur search ke liye UPPER(...) trigram GIN.
+"""
+from datetime import datetime, time
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+# Trigram index 3 characters se chhoti term par kaam nahi aata (seq scan)
+MIN_SEARCH_LENGTH = 3
+
+
+def _parse_list(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parse_moment(param, value, end_of_day=False):
+    try:
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            if day is not None:
+                moment = datetime.combine(day, time.max if end_of_day else time.min)
+    except ValueError:
+        moment = None
+    if moment is None:
+        raise ValidationError({param: ["Enter a valid date or ISO 8601 datetime."]})
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def filter_client_requests(queryset, params):
+    for param, field in (("status", "request_status"), ("industry_type", "industry_type"), ("company_size", "company_size")):
+        values = _parse_list(params.get(param, ""))
+        if len(values) == 1:
+            queryset = queryset.filter(**{field: values[0]})
+        elif values:
+            queryset = queryset.filter(**{f"{field}__in": values})
+
+    if params.get("created_after"):
+        queryset = queryset.filter(created_at__gte=_parse_moment("created_after", params["created_after"]))
+    if params.get("created_before"):
+        queryset = queryset.filter(
+            created_at__lte=_parse_moment("created_before", params["created_before"], end_of_day=True)
+        )
+
+    search = params.get("search", "").strip()
+    if search:
+        if len(search) < MIN_SEARCH_LENGTH:
+            raise ValidationError({"search": [f"Enter at least {MIN_SEARCH_LENGTH} characters."]})
+        # icontains -> UPPER(col::text) LIKE UPPER('%term%'), trigram index isi expression par hai
+        queryset = queryset.filter(
+            Q(client__company_name__icontains=search) | Q(client__company_email__icontains=search)
+        )
+    return queryset
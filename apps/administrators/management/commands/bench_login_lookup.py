@@ -0,0 +1,98 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from apps.administrators.models import Administrator
+from apps.administrators.utils import _admin_login_queryset, find_admin_for_login
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark admin login identifier lookup: legacy Q(email)|Q(username) "
+        "vs. case-insensitive functional-index path. Seeds rows inside a "
+        "transaction that is rolled back unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--lookups", type=int, default=2_000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--keep", action="store_true", help="Seeded rows commit kar do")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options)
+                if not options["keep"]:
+                    raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Seeded rows rolled back.")
+
+    def _run(self, options):
+        rows = options["rows"]
+        self.stdout.write(f"Seeding {rows} administrators ...")
+        start = time.perf_counter()
+        batch = []
+        for i in range(rows):
+            batch.append(Administrator(
+                username=f"bench_admin_{i}",
+                email=f"Bench.Admin.{i}@Example.com",
+                password_hash="!",
+                first_name="Bench",
+                last_name=str(i),
+            ))
+            if len(batch) >= options["batch_size"]:
+                Administrator.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Administrator.objects.bulk_create(batch)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Administrator._meta.db_table}")
+        self.stdout.write(f"Seeded in {time.perf_counter() - start:.1f}s\n")
+
+        sample = [random.randrange(rows) for _ in range(options["lookups"])]
+        identifiers = [
+            f"bench.admin.{i}@example.com" if n % 2 else f"bench_admin_{i}"
+            for n, i in enumerate(sample)
+        ]
+
+        def legacy(identifier):
+            return Administrator.objects.filter(
+                Q(email=identifier) | Q(username=identifier), is_active=True
+            ).first()
+
+        self.stdout.write("== Legacy Q(email) | Q(username) plan ==")
+        self.stdout.write(Administrator.objects.filter(
+            Q(email=identifiers[1]) | Q(username=identifiers[1]), is_active=True
+        ).explain(analyze=True))
+
+        self.stdout.write("\n== Functional index plan (email) ==")
+        self.stdout.write(self._explain_new("email", identifiers[1]))
+        self.stdout.write("\n== Functional index plan (username) ==")
+        self.stdout.write(self._explain_new("username", identifiers[0]))
+
+        self.stdout.write("")
+        self._time("legacy (case-sensitive)", legacy, identifiers)
+        self._time("functional index (case-insensitive)", find_admin_for_login, identifiers)
+
+    def _explain_new(self, field, identifier):
+        return _admin_login_queryset(field, identifier)[:1].explain(analyze=True)
+
+    def _time(self, label, lookup, identifiers):
+        timings = []
+        for identifier in identifiers:
+            start = time.perf_counter()
+            lookup(identifier)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        p50 = timings[len(timings) // 2]
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(f"{label:40s} p50={p50:.3f}ms p95={p95:.3f}ms n={len(timings)}")
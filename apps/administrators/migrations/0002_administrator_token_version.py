@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrators', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='administrator',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrators', '0002_administrator_token_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='administrator',
+            index=models.Index(django.db.models.functions.text.Lower('email'), condition=models.Q(('is_active', True)), name='admin_email_ci_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='administrator',
+            index=models.Index(django.db.models.functions.text.Lower('username'), condition=models.Q(('is_active', True)), name='admin_username_ci_active_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrators', '0003_admin_login_ci_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='administrator',
+            index=models.Index(fields=['-created_at', '-id'], name='admin_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.9 on 2026-10-18 15:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrators', '0004_admin_created_id_idx'),
+        ('core', '0002_counter'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION administrators_counters() RETURNS trigger AS $$
+                DECLARE
+                    total_delta bigint := 0;
+                    active_delta bigint := 0;
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        total_delta := 1;
+                    ELSIF TG_OP = 'DELETE' THEN
+                        total_delta := -1;
+                    END IF;
+                    -- NEW / OLD sirf unke TG_OP mein assigned hote hain, is liye nested IF
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        IF NEW.is_active THEN
+                            active_delta := active_delta + 1;
+                        END IF;
+                    END IF;
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        IF OLD.is_active THEN
+                            active_delta := active_delta - 1;
+                        END IF;
+                    END IF;
+
+                    IF total_delta <> 0 THEN
+                        PERFORM bump_counter('administrators.total', total_delta);
+                    END IF;
+                    IF active_delta <> 0 THEN
+                        PERFORM bump_counter('administrators.active', active_delta);
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER administrators_counters
+                    AFTER INSERT OR DELETE OR UPDATE OF is_active ON adminsistrators
+                    FOR EACH ROW EXECUTE FUNCTION administrators_counters();
+
+                INSERT INTO counters (key, value, updated_at)
+                    SELECT 'administrators.total', COUNT(*), now() FROM adminsistrators
+                    UNION ALL
+                    SELECT 'administrators.active', COUNT(*), now() FROM adminsistrators WHERE is_active
+                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = now();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS administrators_counters ON adminsistrators;
+                DROP FUNCTION IF EXISTS administrators_counters();
+                DELETE FROM counters WHERE key IN ('administrators.total', 'administrators.active');
+            """,
+        ),
+    ]
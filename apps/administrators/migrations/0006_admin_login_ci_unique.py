@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrators', '0005_administrator_counters'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='administrator',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='admin_email_ci_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='administrator',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('username'), name='admin_username_ci_uniq'),
+        ),
+    ]
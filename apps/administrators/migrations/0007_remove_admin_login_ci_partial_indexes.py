@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('administrators', '0006_admin_login_ci_unique'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='administrator',
+            name='admin_email_ci_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='administrator',
+            name='admin_username_ci_active_idx',
+        ),
+    ]
@@ -1,7 +1,14 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
-class TimeStampedModel(models.Model):
+from apps.core.dirty_fields import DirtyFieldsMixin
+
+class TimeStampedModel(DirtyFieldsMixin, models.Model):
+    """
+    created_at / updated_at; bare save() sirf badli hui fields likhta hai
+    (apps.core.dirty_fields).
+    """
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -48,8 +55,24 @@ class Administrator(TimeStampedModel):
 
     last_time = models.DateTimeField(blank=True, null=True)
 
+    # JWT "token_version" claim isse compare hota hai; bump = purane tokens invalid
+    token_version = models.PositiveIntegerField(default=0)
+
     class Meta:
         db_table = "adminsistrators"
+        indexes = [
+            # Keyset pagination (created_at, id)
+            models.Index(fields=["-created_at", "-id"], name="admin_created_id_idx"),
+        ]
+        constraints = [
+            # Login case-insensitive hai, is liye case-variant duplicates bhi nahi;
+            # yehi unique indexes login lookup (utils.find_admin_for_login) bhi serve karte hain
+            models.UniqueConstraint(Lower("email"), name="admin_email_ci_uniq"),
+            models.UniqueConstraint(Lower("username"), name="admin_username_ci_uniq"),
+        ]
 
     def __str__(self):
         return self.username
+
+    def bump_token_version(self):
+        self.token_version += 1
@@ -1,25 +1,16 @@
 from rest_framework.permissions import BasePermission
-from .models import Administrator
+from apps.core.principal import get_principal
 
 class IsAdministrator(BasePermission):
     """
     Allow access only to authenticated administrators
-    (JWT based)
+    (JWT based). Principal AdminJWTAuthentication pehle hi load kar chuki
+    hoti hai, is liye yahan koi query nahi chalti.
     """
 
     def has_permission(self, request, view):
-        if not hasattr(request, "auth") or not request.auth:
+        principal = get_principal(request)
+        if principal is None:
             return False
 
-        if request.auth.get("role") != "administrator":
-            return False
-
-        admin_id = request.auth.get("admin_id")
-        if not admin_id:
-            return False
-
-        return Administrator.objects.filter(
-            id=admin_id,
-            is_active=True
-        ).exists()
-
+        return principal.is_administrator
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from django.contrib.auth.hashers import make_password
+from apps.core.hashing import password_hashing
 from .models import Administrator, AdministratorRole
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
@@ -13,6 +13,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token['username'] = user.username
         token['email'] = user.email
         token['role'] = 'administrator'
+        token['token_version'] = user.token_version
         
         return token
     
@@ -74,9 +75,20 @@ class AdministratorCreateSerializer(serializers.ModelSerializer):
             "last_name", "role", "designation"
         )
 
+    def validate_email(self, value):
+        # DB constraint Lower(email) par hai; yahan saaf 400 message
+        if Administrator.objects.filter(email__iexact=value).exists():
+            raise serializers.ValidationError("An administrator with this email already exists.")
+        return value
+
+    def validate_username(self, value):
+        if Administrator.objects.filter(username__iexact=value).exists():
+            raise serializers.ValidationError("An administrator with this username already exists.")
+        return value
+
     def create(self, validated_data):
         # Password ko hash karna zaroori hai
-        validated_data['password_hash'] = make_password(validated_data.pop('password'))
+        validated_data['password_hash'] = password_hashing.make_password(validated_data.pop('password'))
         return super().create(validated_data)
 
 
@@ -104,4 +116,17 @@ class PasswordChangeSerializer(serializers.Serializer):
     def validate(self, data):
         if data['new_password'] != data['confirm_password']:
             raise serializers.ValidationError({"password": "New passwords do not match."})
-        return data
\ No newline at end of file
+        return data
+
+class BulkClientRequestDecisionSerializer(serializers.Serializer):
+    """
+    Bulk approve / reject: {"ids": [1, 2, 3], "status": "approved"}
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
+    status = serializers.ChoiceField(choices=["approved", "rejected"])
+
+    def validate_ids(self, value):
+        # Duplicates hata do, order wahi rahe (response usi order mein)
+        return list(dict.fromkeys(value))
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.principal_cache import principal_cache
+from apps.core.response_cache import bump_table_version
+from .models import Administrator, AdministratorRole
+
+
+@receiver([post_save, post_delete], sender=Administrator)
+def invalidate_administrator_principal(sender, instance, **kwargs):
+    """
+    toggle_status, password change, profile PATCH sab save() se guzarte hain,
+    is liye cached principal yahan drop ho jata hai.
+    """
+    principal_cache.invalidate("administrator", instance.pk)
+    bump_table_version(Administrator)
+
+
+@receiver([post_save, post_delete], sender=AdministratorRole)
+def bump_administrator_role_version(sender, instance, **kwargs):
+    # Management list role_name render karti hai
+    bump_table_version(AdministratorRole)
@@ -1,3 +1,268 @@
-from django.test import TestCase
+import json
+import time
+from datetime import timedelta
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.clients.models import Client, ClientRequest
+from apps.core.compiled_serializers import compile_serializer
+from apps.core.fieldsets import _sparse_class
+from apps.core.hashing import password_hashing
+from apps.core.testing import ConstantQueryCountMixin
+from .models import Administrator, AdministratorRole
+from .serializers import AdministratorCreateSerializer, AdministratorSerializer
+from .utils import find_admin_for_login, get_tokens_for_administrator
+
+
+def create_admin(username="admin", email="admin@example.com", password="secret-pass", **extra):
+    return Administrator.objects.create(
+        username=username,
+        email=email,
+        password_hash=password_hashing.make_password(password),
+        first_name="Test",
+        last_name="Admin",
+        **extra,
+    )
+
+
+class AdministratorLoginTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = create_admin(username="Owner", email="Owner@Example.com")
+
+    def test_missing_identifier_is_401(self):
+        response = self.client.post("/api/admin/login/", {"password": "secret-pass"}, format="json")
+        self.assertEqual(response.status_code, 401)
+
+    def test_non_string_identifier_is_401(self):
+        for identifier in (123, ["owner"], {"a": 1}):
+            response = self.client.post(
+                "/api/admin/login/", {"email_or_username": identifier, "password": "secret-pass"}, format="json"
+            )
+            self.assertEqual(response.status_code, 401)
+
+    def test_case_insensitive_email_and_username(self):
+        for identifier in ("owner@example.com", "OWNER"):
+            response = self.client.post(
+                "/api/admin/login/", {"email_or_username": identifier, "password": "secret-pass"}, format="json"
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_at_identifier_probes_email_then_username(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(find_admin_for_login(" Owner@Example.COM "), self.admin)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertIsNone(find_admin_for_login("nobody@example.com"))
+        self.assertEqual(len(ctx.captured_queries), 2)
+        # Har query ek hi index probe, OR (BitmapOr) nahi
+        for query in ctx.captured_queries:
+            self.assertNotIn(" OR ", query["sql"])
+
+    def test_username_containing_at_sign(self):
+        other = create_admin(username="ops@team", email="ops@example.com")
+        self.assertEqual(find_admin_for_login("OPS@team"), other)
+
+
+class AdministratorCreateTests(TestCase):
+    def test_case_variant_duplicates_rejected(self):
+        create_admin()
+        serializer = AdministratorCreateSerializer(data={
+            "username": "ADMIN", "email": "ADMIN@example.com", "password": "another-pass",
+            "first_name": "Dup", "last_name": "Admin",
+        })
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("email", serializer.errors)
+        self.assertIn("username", serializer.errors)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+class AdminListQueryCountTests(ConstantQueryCountMixin, TestCase):
+    # Response cache band (DummyCache): har call asal list query chalaye
+
+    def setUp(self):
+        self.admin = create_admin()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_administrator(self.admin)['access']}")
+        self.role = AdministratorRole.objects.create(role_name="Manager")
+        self.counter = 0
+
+    def _numbers(self, n):
+        start = self.counter
+        self.counter += n
+        return range(start, self.counter)
+
+    def make_admins(self, n):
+        Administrator.objects.bulk_create([
+            Administrator(
+                username=f"staff{i}", email=f"staff{i}@example.com", password_hash="!",
+                first_name="Staff", last_name=str(i), role=self.role,
+            )
+            for i in self._numbers(n)
+        ])
+
+    def make_client_requests(self, n):
+        clients = Client.objects.bulk_create([
+            Client(company_name=f"Company {i}", company_email=f"c{i}@example.com", password_hash="!")
+            for i in self._numbers(n)
+        ])
+        ClientRequest.objects.bulk_create([
+            ClientRequest(client=client, company_phone="123", industry_type="IT", company_size="11-50")
+            for client in clients
+        ])
+
+    def test_admin_management_list(self):
+        self.assertConstantQueryCount(self.make_admins, lambda: self.client.get("/api/admin/management/"))
+
+    def test_client_request_list(self):
+        self.assertConstantQueryCount(self.make_client_requests, lambda: self.client.get("/api/admin/client-requests/"))
+
+
+class AdminProfileConditionalTests(TestCase):
+    def setUp(self):
+        self.role = AdministratorRole.objects.create(role_name="Manager")
+        self.admin = create_admin(role=self.role)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_administrator(self.admin)['access']}")
+
+    def _etag(self):
+        response = self.client.get("/api/admin/profile/")
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def test_unchanged_profile_is_304(self):
+        etag = self._etag()
+        response = self.client.get("/api/admin/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def _settle(self):
+        # Dono validator timestamps pichle seconds mein
+        past = timezone.now() - timedelta(seconds=30)
+        Administrator.objects.filter(pk=self.admin.pk).update(updated_at=past)
+        AdministratorRole.objects.filter(pk=self.role.pk).update(updated_at=past)
+
+    def test_change_in_current_second_has_no_date_validator(self):
+        response = self.client.get("/api/admin/profile/")
+        self.assertNotIn("Last-Modified", response)
+        response = self.client.get("/api/admin/profile/", HTTP_IF_MODIFIED_SINCE=http_date(time.time()))
+        self.assertEqual(response.status_code, 200)
+
+    def test_settled_profile_is_304_by_date(self):
+        self._settle()
+        last_modified = self.client.get("/api/admin/profile/")["Last-Modified"]
+        response = self.client.get("/api/admin/profile/", HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_takes_precedence_over_date(self):
+        self._settle()
+        response = self.client.get(
+            "/api/admin/profile/", HTTP_IF_NONE_MATCH='"stale"', HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60)
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_role_rename_changes_etag(self):
+        etag = self._etag()
+        self.role.role_name = "Director"
+        self.role.save()
+        response = self.client.get("/api/admin/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["role_name"], "Director")
+
+    def test_last_seen_flush_changes_etag(self):
+        from apps.core.last_seen import last_seen_buffer
+
+        etag = self._etag()
+        last_seen_buffer.record(Administrator, self.admin.pk, "last_time", timezone.now())
+        last_seen_buffer.flush()
+        response = self.client.get("/api/admin/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class AdminManagementCacheTests(TestCase):
+    def setUp(self):
+        self.role = AdministratorRole.objects.create(role_name="Manager")
+        self.admin = create_admin(role=self.role)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_administrator(self.admin)['access']}")
+
+    def _role_names(self):
+        response = self.client.get("/api/admin/management/")
+        self.assertEqual(response.status_code, 200)
+        return [row["role_name"] for row in response.data["results"]]
+
+    def test_role_rename_invalidates_cached_list(self):
+        self.assertEqual(self._role_names(), ["Manager"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.role.role_name = "Director"
+            self.role.save()
+        self.assertEqual(self._role_names(), ["Director"])
+
+    def test_stats_keep_principal_cache_fields_at_top_level(self):
+        response = self.client.get("/api/admin/principal-cache-stats/")
+        self.assertEqual(response.status_code, 200)
+        for key in ("size", "hits", "misses", "hit_ratio", "response_cache", "password_hashing"):
+            self.assertIn(key, response.data)
+
+
+class AdminToggleStatusTests(TestCase):
+    def setUp(self):
+        self.admin = create_admin()
+        self.target = create_admin(username="staff", email="staff@example.com")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_administrator(self.admin)['access']}")
+
+    def toggle(self, pk, body=None):
+        return self.client.patch(f"/api/admin/management/{pk}/toggle-status/", body or {}, format="json")
+
+    def test_flip_twice(self):
+        self.assertEqual(self.toggle(self.target.pk).data["is_active"], False)
+        self.assertEqual(self.toggle(self.target.pk).data["is_active"], True)
+        self.target.refresh_from_db()
+        self.assertTrue(self.target.is_active)
+        # Sirf deactivation par token_version bump
+        self.assertEqual(self.target.token_version, 1)
+
+    def test_explicit_target_is_idempotent(self):
+        for _ in range(2):
+            response = self.toggle(self.target.pk, {"is_active": False})
+            self.assertEqual(response.status_code, 200)
+            self.assertIs(response.data["is_active"], False)
+        self.target.refresh_from_db()
+        self.assertEqual(self.target.token_version, 1)
+
+    def test_unknown_or_non_numeric_pk_is_404(self):
+        for pk in (self.target.pk + 100, "abc"):
+            self.assertEqual(self.toggle(pk).status_code, 404)
+
+
+class CompiledAdministratorSerializerTests(TestCase):
+    def setUp(self):
+        self.admin = create_admin()
+        create_admin(username="staff", email="staff@example.com", role=AdministratorRole.objects.create(role_name="Ops"))
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_administrator(self.admin)['access']}")
+
+    def test_role_name_over_nullable_fk_is_not_compiled(self):
+        self.assertIsNone(compile_serializer(AdministratorSerializer))
+        self.assertIsNotNone(compile_serializer(_sparse_class(AdministratorSerializer, ("id", "email"))))
+
+    def test_export_matches_stock_serializer_for_null_role(self):
+        response = self.client.get("/api/admin/management/export/")
+        self.assertEqual(response.status_code, 200)
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        queryset = Administrator.objects.order_by("-created_at", "-id")
+        expected = json.loads(JSONRenderer().render(AdministratorSerializer(queryset, many=True).data))
+        self.assertEqual(rows, expected)
+        self.assertNotIn("role_name", rows[-1])
+        self.assertEqual(rows[0]["role_name"], "Ops")
+
+    def test_csv_export_with_skipped_key(self):
+        response = self.client.get("/api/admin/management/export/", {"file_format": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(b"".join(response.streaming_content).decode().splitlines()), 3)
@@ -3,13 +3,20 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     AdministratorLoginAPIView, 
     ClientRequestListAPIView, 
+    ClientRequestExportAPIView,
+    ClientExportAPIView,
+    ClientUserExportAPIView,
     ApproveClientRequestAPIView,
+    BulkClientRequestDecisionAPIView,
     AdministratorManagementViewSet,
     AdminProfileAPIView,
     AdminPasswordChangeAPIView,
     AdminDashboardStatsAPIView,
+    PrincipalCacheStatsAPIView,
+    AdminLogoutAPIView,
      
 )
+from .async_views import administrator_login_async
 
 # Router ViewSets ke liye use hota hai (CRUD operations automatically handle karta hai)
 router = DefaultRouter()
@@ -18,13 +25,20 @@ router.register(r'management', AdministratorManagementViewSet, basename='admin-m
 urlpatterns = [
     # Existing URLs
     path("login/", AdministratorLoginAPIView.as_view(), name="admin-login"),
+    path("login/async/", administrator_login_async, name="admin-login-async"),
+    path("logout/", AdminLogoutAPIView.as_view(), name="admin-logout"),
     path("client-requests/", ClientRequestListAPIView.as_view(), name="admin-client-request-list"),
+    path("client-requests/export/", ClientRequestExportAPIView.as_view(), name="admin-client-request-export"),
+    path("clients/export/", ClientExportAPIView.as_view(), name="admin-client-export"),
+    path("client-users/export/", ClientUserExportAPIView.as_view(), name="admin-client-user-export"),
     path("client-requests/<int:request_id>/approve/", ApproveClientRequestAPIView.as_view(), name="admin-approve-client-request"),
+    path("client-requests/bulk-decision/", BulkClientRequestDecisionAPIView.as_view(), name="admin-bulk-client-request-decision"),
 
     # New URLs
     path("profile/", AdminProfileAPIView.as_view(), name="admin-profile"),
     path("change-password/", AdminPasswordChangeAPIView.as_view(), name="admin-change-password"),
     path("dashboard-stats/", AdminDashboardStatsAPIView.as_view(), name="admin-dashboard-stats"),
+    path("principal-cache-stats/", PrincipalCacheStatsAPIView.as_view(), name="admin-principal-cache-stats"),
      # ViewSet URLs (management/ se start honge)
     path("", include(router.urls)),
 ]
\ No newline at end of file
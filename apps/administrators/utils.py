@@ -1,18 +1,19 @@
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.db.models import Q
-from django.contrib.auth.hashers import check_password
+from django.db.models.functions import Lower
 
+from apps.core.hashing import apersist_rehash, password_hashing, persist_rehash
 from .models import Administrator
 
 
 def get_tokens_for_administrator(admin):
     """
     Generate JWT refresh and access tokens for Administrator
-    with custom claims: admin_id and role
+    with custom claims: admin_id, role and token_version
     """
     refresh = RefreshToken.for_user(admin)  # link with admin object
     refresh["admin_id"] = admin.id
     refresh["role"] = "administrator"
+    refresh["token_version"] = admin.token_version
 
     return {
         "refresh": str(refresh),
@@ -20,20 +21,82 @@ def get_tokens_for_administrator(admin):
     }
 
 
-def authenticate_admin_with_email_or_username(identifier, password):
+def normalize_login_identifier(identifier):
     """
-    Authenticate Administrator by email or username
+    Lowercased identifier, ya None agar value string nahi / khaali hai
+    (missing ya JSON number / list wala field 500 nahi, 401 banta hai).
     """
-    try:
-        admin = Administrator.objects.get(
-            Q(email=identifier) | Q(username=identifier),
-            is_active=True
-        )
-    except Administrator.DoesNotExist:
+    if not isinstance(identifier, str):
         return None
+    return identifier.strip().lower() or None
+
+
+LOGIN_FIELDS = ("email", "username")
+
+
+def _admin_login_queryset(field, identifier):
+    """
+    lower(email) ya lower(username) par ek index probe (Lower() unique
+    constraints, is liye zyada se zyada ek row).
+    """
+    return Administrator.objects.alias(**{f"{field}_ci": Lower(field)}).filter(
+        is_active=True, **{f"{field}_ci": identifier}
+    )
+
 
-    if check_password(password, admin.password_hash):
+def _login_fields(identifier):
+    # '@' wala identifier pehle email, phir username (username mein bhi '@' ho sakta hai)
+    return LOGIN_FIELDS if "@" in identifier else ("username",)
+
+
+def find_admin_for_login(identifier):
+    identifier = normalize_login_identifier(identifier)
+    if identifier is None:
+        return None
+    for field in _login_fields(identifier):
+        admin = _admin_login_queryset(field, identifier).first()
+        if admin is not None:
+            return admin
+    return None
+
+
+async def afind_admin_for_login(identifier):
+    identifier = normalize_login_identifier(identifier)
+    if identifier is None:
+        return None
+    for field in _login_fields(identifier):
+        admin = await _admin_login_queryset(field, identifier).afirst()
+        if admin is not None:
+            return admin
+    return None
+
+
+def authenticate_admin_with_email_or_username(identifier, password):
+    """
+    Authenticate Administrator by email or username (case-insensitive).
+    Hashing off-thread pool par hoti hai; admin na mile tab bhi dummy hash chalta hai.
+    """
+    admin = find_admin_for_login(identifier)
+
+    encoded = admin.password_hash if admin else None
+    matched, rehashed = password_hashing.verify(password, encoded)
+    if matched:
+        persist_rehash(admin, rehashed)
         return admin
 
     return None
 
+
+async def aauthenticate_admin_with_email_or_username(identifier, password):
+    """
+    Async variant for the ASGI login view.
+    """
+    admin = await afind_admin_for_login(identifier)
+
+    encoded = admin.password_hash if admin else None
+    matched, rehashed = await password_hashing.averify(password, encoded)
+    if matched:
+        await apersist_rehash(admin, rehashed)
+        return admin
+
+    return None
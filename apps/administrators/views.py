@@ -2,23 +2,43 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from django.db import connection, transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.contrib.auth.hashers import check_password, make_password
+from apps.core.hashing import password_hashing
+from apps.core.idempotency import idempotent
+from apps.core.last_seen import last_seen_buffer
+from apps.core.logout import BaseLogoutAPIView
+from apps.core.pagination import KeysetPagination
+from apps.core.compiled_serializers import paginated_list_response
+from apps.core.conditional import conditional_response
+from apps.core.counters import read_counters
+from apps.core.exports import get_export_format, stream_export
+from apps.core.fieldsets import sparse_serializer_class
+from apps.core.query_planning import QueryPlanningMixin
+from apps.core.response_cache import bump_table_version, cached_response, response_cache_stats
+from apps.core.status_toggle import StatusToggleSerializer, set_active_state
+from apps.core.throttling import LoginRateThrottle
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import Administrator
+from .models import Administrator, AdministratorRole
 from .serializers import (
     AdminLoginSerializer, AdministratorSerializer, 
     AdministratorCreateSerializer, AdministratorProfileUpdateSerializer,
-    PasswordChangeSerializer
+    PasswordChangeSerializer, BulkClientRequestDecisionSerializer
 )
 from .utils import authenticate_admin_with_email_or_username, get_tokens_for_administrator
 from .permissions import IsAdministrator
+from .filters import filter_client_requests
+from .counters import ACTIVE_ADMINS, TOTAL_ADMINS
 from .authentication import AdminJWTAuthentication
+from apps.core.principal_cache import principal_cache
+from apps.core.token_cache import verified_token_cache
 
-from apps.clients.models import ClientRequest 
-from apps.clients.serializers import ClientRequestSerializer
+from apps.clients.counters import PENDING_CLIENT_REQUESTS
+from apps.clients.models import Client, ClientRequest, ClientUser
+from apps.clients.serializers import ClientProfileSerializer, ClientRequestSerializer, ClientUserSerializer
 
 from rest_framework_simplejwt.views import TokenObtainPairView
 from .serializers import CustomTokenObtainPairSerializer
@@ -27,6 +47,9 @@ from .serializers import CustomTokenObtainPairSerializer
 # --- Existing Views ---
 class AdministratorLoginAPIView(APIView):
      permission_classes = [] 
+     throttle_classes = [LoginRateThrottle]
+     login_identifier_field = "email_or_username"
+     login_throttle_scope = "admin-login"
 
      def post(self, request):
          identifier = request.data.get("email_or_username")
@@ -35,23 +58,65 @@ class AdministratorLoginAPIView(APIView):
          if not user:
              return Response({"error": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
         
-         # Last login update yahan professional tareeqa hai
-         user.last_time = timezone.now()
-         user.save()
+         # Last login write-behind buffer se batch mein flush hota hai
+         last_seen_buffer.record(Administrator, user.pk, "last_time")
         
          tokens = get_tokens_for_administrator(user)
          return Response({"message": "Admin login successful", "tokens": tokens})
 # In views.py, add these missing classes:
 
+def client_request_queryset(request):
+    """
+    List aur export dono yahi queryset use karte hain (same filters).
+    """
+    return filter_client_requests(ClientRequest.objects.all(), request.query_params)
+
+
 class ClientRequestListAPIView(APIView):
     permission_classes = [IsAdministrator]
     authentication_classes = [AdminJWTAuthentication]
 
     def get(self, request):
-        
-        requests = ClientRequest.objects.all().order_by("-created_at")
-        serializer = ClientRequestSerializer(requests, many=True)
-        return Response(serializer.data)
+        return cached_response(
+            request, "admin-client-requests", [ClientRequest, Client],
+            lambda: paginated_list_response(
+                KeysetPagination(), client_request_queryset(request), ClientRequestSerializer, request, view=self
+            ),
+            scope="administrator",
+        )
+
+
+class ClientRequestExportAPIView(APIView):
+    """
+    Streaming NDJSON / CSV export (?file_format=ndjson|csv).
+    """
+    permission_classes = [IsAdministrator]
+    authentication_classes = [AdminJWTAuthentication]
+
+    def get(self, request):
+        export_format = get_export_format(request)
+        queryset = client_request_queryset(request).order_by("-created_at", "-id")
+        return stream_export(queryset, ClientRequestSerializer, export_format, "client_requests")
+
+
+class ClientExportAPIView(APIView):
+    permission_classes = [IsAdministrator]
+    authentication_classes = [AdminJWTAuthentication]
+
+    def get(self, request):
+        export_format = get_export_format(request)
+        queryset = Client.objects.order_by("-created_at", "-id")
+        return stream_export(queryset, ClientProfileSerializer, export_format, "clients")
+
+
+class ClientUserExportAPIView(APIView):
+    permission_classes = [IsAdministrator]
+    authentication_classes = [AdminJWTAuthentication]
+
+    def get(self, request):
+        export_format = get_export_format(request)
+        queryset = ClientUser.objects.order_by("-created_at", "-id")
+        return stream_export(queryset, ClientUserSerializer, export_format, "client_users")
 
 
 class ApproveClientRequestAPIView(APIView):
@@ -71,29 +136,133 @@ class ApproveClientRequestAPIView(APIView):
             {"message": "Client request approved successfully"},
             status=status.HTTP_200_OK
         )
+
+
+def decide_pending_client_requests(ids, request_status, administrator):
+    """
+    Ek set-based UPDATE ... WHERE request_status = 'pending' RETURNING id.
+    Sirf pending rows badalti hain, is liye concurrent admin ke saath
+    double-approve nahi hota. Updated ids ka set return karta hai.
+    """
+    quote = connection.ops.quote_name
+    opts = ClientRequest._meta
+    columns = {name: quote(opts.get_field(name).column) for name in (
+        "id", "request_status", "approved_by_administrator", "approved_at", "updated_at"
+    )}
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {quote(opts.db_table)} "
+            f"SET {columns['request_status']} = %s, {columns['approved_by_administrator']} = %s, "
+            f"{columns['approved_at']} = %s, {columns['updated_at']} = %s "
+            f"WHERE {columns['id']} = ANY(%s) AND {columns['request_status']} = %s "
+            f"RETURNING {columns['id']}",
+            [request_status, administrator.pk, now, now, list(ids), "pending"],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+class BulkClientRequestDecisionAPIView(APIView):
+    """
+    Bulk approve / reject ek transaction mein, har id ka outcome:
+    updated, already_processed (current status ke saath) ya not_found.
+    Rejection par bhi deciding admin / time approved_by_* columns mein
+    likhe jate hain.
+    """
+    permission_classes = [IsAdministrator]
+    authentication_classes = [AdminJWTAuthentication]
+
+    def post(self, request):
+        serializer = BulkClientRequestDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        target = serializer.validated_data["status"]
+
+        with transaction.atomic():
+            updated = decide_pending_client_requests(ids, target, request.user)
+            remaining = [pk for pk in ids if pk not in updated]
+            current = dict(
+                ClientRequest.objects.filter(id__in=remaining).values_list("id", "request_status")
+            ) if remaining else {}
+
+        if updated:
+            # .update() / raw SQL signals nahi bhejta, list cache khud invalidate
+            bump_table_version(ClientRequest)
+
+        results = []
+        for pk in ids:
+            if pk in updated:
+                results.append({"id": pk, "outcome": "updated", "request_status": target})
+            elif pk in current:
+                results.append({"id": pk, "outcome": "already_processed", "request_status": current[pk]})
+            else:
+                results.append({"id": pk, "outcome": "not_found"})
+
+        return Response({
+            "status": target,
+            "updated": len(updated),
+            "already_processed": len(current),
+            "not_found": len(ids) - len(updated) - len(current),
+            "results": results,
+        }, status=status.HTTP_200_OK)
 # --- New User Management ViewSet ---
-class AdministratorManagementViewSet(viewsets.ModelViewSet):
+class AdministratorManagementViewSet(QueryPlanningMixin, viewsets.ModelViewSet):
     """
     Admin/Manager CRUD aur Status Toggle ke liye.
     URL endpoints: list, create, retrieve, partial_update
     """
-    queryset = Administrator.objects.all().order_by("-created_at")
+    queryset = Administrator.objects.all().order_by("-created_at", "-id")
     authentication_classes = [AdminJWTAuthentication]
     permission_classes = [IsAdministrator]
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):
         if self.action == 'create':
             return AdministratorCreateSerializer
-        return AdministratorSerializer
+        # ?fields= / ?exclude= (sirf GET par)
+        return sparse_serializer_class(AdministratorSerializer, self.request)
+
+    def list(self, request, *args, **kwargs):
+        parent_list = super().list
+        return cached_response(
+            # role_name AdministratorRole se aata hai
+            request, "admin-management", [Administrator, AdministratorRole],
+            lambda: parent_list(request, *args, **kwargs),
+            scope="administrator",
+        )
+
+    @idempotent("admin-management-create")
+    def create(self, request, *args, **kwargs):
+        # Idempotency-Key: retry par dobara hash / insert nahi
+        return super().create(request, *args, **kwargs)
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """Streaming NDJSON / CSV export: management/export/?file_format=csv"""
+        export_format = get_export_format(request)
+        queryset = self.filter_queryset(self.get_queryset())
+        return stream_export(queryset, self.get_serializer_class(), export_format, "administrators")
 
     @action(detail=True, methods=['patch'], url_path='toggle-status')
     def toggle_status(self, request, pk=None):
-        """Custom endpoint: admin/id/toggle-status/"""
-        admin_user = self.get_object()
-        admin_user.is_active = not admin_user.is_active
-        admin_user.save()
-        status_msg = "activated" if admin_user.is_active else "deactivated"
-        return Response({"message": f"User {status_msg} successfully"})
+        """
+        Custom endpoint: admin/id/toggle-status/
+        Body optional: {"is_active": true|false} (idempotent), warna flip.
+        Deactivation par token_version bump = outstanding tokens khatam.
+        """
+        serializer = StatusToggleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        is_active = set_active_state(
+            self.get_queryset(), pk, serializer.validated_data["is_active"], principal_kind="administrator"
+        )
+        if is_active is None:
+            raise Http404
+        status_msg = "activated" if is_active else "deactivated"
+        return Response({"message": f"User {status_msg} successfully", "is_active": is_active})
+
+class AdminLogoutAPIView(BaseLogoutAPIView):
+    authentication_classes = [AdminJWTAuthentication]
+    permission_classes = [IsAdministrator]
 
 # --- Profile & Security Views ---
 class AdminProfileAPIView(APIView):
@@ -101,8 +270,16 @@ class AdminProfileAPIView(APIView):
     permission_classes = [IsAdministrator]
 
     def get(self, request):
-        serializer = AdministratorSerializer(request.user)
-        return Response(serializer.data)
+        def render(updated_at):
+            # Cached principal ka role (role_name) purana ho sakta hai, fresh row lo
+            admin = Administrator.objects.select_related("role").get(pk=request.user.pk)
+            return Response(AdministratorSerializer(admin).data)
+
+        # ETag / If-None-Match / If-Modified-Since: unchanged profile (aur role) par 304
+        return conditional_response(
+            request, Administrator, request.user.pk, render,
+            validators=("updated_at", "role__updated_at"),
+        )
 
     def patch(self, request):
         serializer = AdministratorProfileUpdateSerializer(request.user, data=request.data, partial=True)
@@ -119,10 +296,11 @@ class AdminPasswordChangeAPIView(APIView):
         serializer = PasswordChangeSerializer(data=request.data)
         if serializer.is_valid():
             user = request.user
-            if not check_password(serializer.validated_data['old_password'], user.password_hash):
+            if not password_hashing.check_password(serializer.validated_data['old_password'], user.password_hash):
                 return Response({"error": "Old password is incorrect"}, status=status.HTTP_400_BAD_REQUEST)
             
-            user.password_hash = make_password(serializer.validated_data['new_password'])
+            user.password_hash = password_hashing.make_password(serializer.validated_data['new_password'])
+            user.bump_token_version()
             user.save()
             return Response({"message": "Password changed successfully"})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -133,11 +311,29 @@ class AdminDashboardStatsAPIView(APIView):
     permission_classes = [IsAdministrator]
 
     def get(self, request):
+        # Trigger-maintained counters: teen COUNT(*) ki jagah ek indexed read
+        counters = read_counters([TOTAL_ADMINS, ACTIVE_ADMINS, PENDING_CLIENT_REQUESTS])
         data = {
-            "total_admins": Administrator.objects.count(),
-            "active_admins": Administrator.objects.filter(is_active=True).count(),
-            "pending_client_requests": ClientRequest.objects.filter(request_status="pending").count(),
+            "total_admins": counters[TOTAL_ADMINS],
+            "active_admins": counters[ACTIVE_ADMINS],
+            "pending_client_requests": counters[PENDING_CLIENT_REQUESTS],
         }
         return Response(data)
-    
 
+
+class PrincipalCacheStatsAPIView(APIView):
+    """
+    Principal cache ke hit/miss counters (top level, jaise pehle), saath mein
+    verified-token / response cache aur password hashing timings (sirf is
+    worker process ke).
+    """
+    authentication_classes = [AdminJWTAuthentication]
+    permission_classes = [IsAdministrator]
+
+    def get(self, request):
+        return Response({
+            **principal_cache.stats(),
+            "verified_token_cache": verified_token_cache.stats(),
+            "password_hashing": password_hashing.metrics.snapshot(),
+            "response_cache": response_cache_stats.snapshot(),
+        })
@@ -6,4 +6,5 @@ class ClientsConfig(AppConfig):
     name = 'apps.clients'
 
     def ready(self):
-        import apps.clients.signals
\ No newline at end of file
+        import apps.clients.counters
+        import apps.clients.signals
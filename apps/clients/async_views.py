@@ -0,0 +1,110 @@
+"""
+Native async signup / login views for clients and staff. ASGI (hrm/asgi.py)
+par in ka password hashing event loop ko block nahi karta.
+"""
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from apps.core.hashing import HashingServiceBusy, password_hashing
+from apps.core.last_seen import last_seen_buffer
+from apps.core.http import error_response, parse_json_body, throttled_response
+from apps.core.throttling import get_client_ip, login_throttle
+from .models import Client, ClientUser
+from .serializers import ClientSignupSerializer
+from .utils import (
+    aauthenticate_client,
+    aauthenticate_client_user,
+    get_tokens_for_client,
+    get_tokens_for_client_user,
+)
+
+
+@csrf_exempt
+@require_POST
+async def client_signup_async(request):
+    data = parse_json_body(request)
+    if data is None:
+        return error_response("Invalid JSON body", 400)
+
+    password = data.get("password")
+    serializer = ClientSignupSerializer(data=data)
+    # Validation mein unique-email query hai, is liye thread par chalate hain
+    if not await sync_to_async(serializer.is_valid)():
+        return JsonResponse(serializer.errors, status=400)
+
+    try:
+        password_hash = await password_hashing.amake_password(password)
+    except HashingServiceBusy as exc:
+        return error_response(str(exc.detail), exc.status_code)
+
+    validated_data = dict(serializer.validated_data)
+    validated_data.pop("password")
+    client = await Client.objects.acreate(password_hash=password_hash, **validated_data)
+
+    return JsonResponse({"message": "Signup successful.", "client_id": client.id}, status=201)
+
+
+@csrf_exempt
+@require_POST
+async def client_login_async(request):
+    data = parse_json_body(request)
+    if data is None:
+        return error_response("Invalid JSON body", 400)
+
+    email = data.get("company_email")
+    password = data.get("password")
+    if not email or not password:
+        return error_response("Email and password required", 400)
+
+    wait = login_throttle.check("client-login", get_client_ip(request), email)
+    if wait is not None:
+        return throttled_response(wait)
+
+    try:
+        client = await aauthenticate_client(email, password)
+    except HashingServiceBusy as exc:
+        return error_response(str(exc.detail), exc.status_code)
+
+    if not client:
+        return error_response("Invalid credentials", 401)
+
+    last_seen_buffer.record(Client, client.pk, "last_login")
+    return JsonResponse({"tokens": get_tokens_for_client(client)})
+
+
+@csrf_exempt
+@require_POST
+async def client_user_login_async(request):
+    data = parse_json_body(request)
+    if data is None:
+        return error_response("Invalid JSON body", 400)
+
+    identifier = data.get("email")
+    password = data.get("password")
+    if not identifier or not password:
+        return error_response("Email and password required", 400)
+
+    wait = login_throttle.check("client-user-login", get_client_ip(request), identifier)
+    if wait is not None:
+        return throttled_response(wait)
+
+    try:
+        user = await aauthenticate_client_user(identifier, password)
+    except HashingServiceBusy as exc:
+        return error_response(str(exc.detail), exc.status_code)
+
+    if not user:
+        return error_response("Invalid staff credentials", 401)
+
+    last_seen_buffer.record(ClientUser, user.pk, "last_login")
+
+    return JsonResponse({
+        "message": "Staff login successful",
+        "user_details": {
+            "name": user.full_name,
+            "role": user.role.role_name if user.role else "No Role"
+        },
+        "tokens": get_tokens_for_client_user(user)
+    })
@@ -0,0 +1,128 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework import exceptions
+from apps.core.principal import Principal, attach_principal, check_token_version
+from apps.core.principal_cache import principal_cache
+from apps.core.token_cache import CachedTokenValidationMixin
+from apps.administrators.authentication import AdminJWTAuthentication
+from .models import Client, ClientUser
+
+
+class ClientJWTAuthentication(CachedTokenValidationMixin, JWTAuthentication):
+    """
+    JWT authentication for company owners (role = "client").
+    Dusre role ke token par None return karta hai taake agla
+    authenticator try ho sake.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if validated_token.get("role") != "client":
+            return None
+
+        user = self.get_user(validated_token)
+        attach_principal(request, Principal.CLIENT, user, validated_token)
+        return user, validated_token
+
+    def get_user(self, validated_token):
+        client_id = validated_token.get("client_id")
+        if not client_id:
+            raise exceptions.AuthenticationFailed("Client ID missing in token")
+
+        try:
+            client = principal_cache.get_or_load(
+                "client",
+                client_id,
+                lambda: Client.objects.get(id=client_id, is_active=True),
+            )
+        except Client.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Client not found or inactive")
+
+        if not check_token_version(client, validated_token):
+            raise exceptions.AuthenticationFailed("Token is no longer valid")
+
+        return client
+
+
+class ClientUserJWTAuthentication(CachedTokenValidationMixin, JWTAuthentication):
+    """
+    JWT authentication for company staff (role = "client_user").
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if validated_token.get("role") != "client_user":
+            return None
+
+        user = self.get_user(validated_token)
+        attach_principal(request, Principal.CLIENT_USER, user, validated_token)
+        return user, validated_token
+
+    def get_user(self, validated_token):
+        client_user_id = validated_token.get("client_user_id")
+        if not client_user_id:
+            raise exceptions.AuthenticationFailed("Client user ID missing in token")
+
+        try:
+            user = principal_cache.get_or_load(
+                "client_user",
+                client_user_id,
+                lambda: ClientUser.objects.get(id=client_user_id, is_active=True),
+            )
+        except ClientUser.DoesNotExist:
+            raise exceptions.AuthenticationFailed("Client user not found or inactive")
+
+        if not check_token_version(user, validated_token):
+            raise exceptions.AuthenticationFailed("Token is no longer valid")
+
+        # Add is_authenticated property to satisfy DRF
+        user.is_authenticated = True
+        return user
+
+
+class ClientPrincipalJWTAuthentication(CachedTokenValidationMixin, JWTAuthentication):
+    """
+    Token sirf ek dafa decode/verify hota hai, phir `role` claim par
+    dispatch karke exactly ek principal load hota hai. Multiple
+    authenticators ki list (aur double decode) ki jagah yeh use karein.
+    """
+
+    principal_authenticators = {
+        Principal.CLIENT: ClientJWTAuthentication,
+        Principal.CLIENT_USER: ClientUserJWTAuthentication,
+        Principal.ADMINISTRATOR: AdminJWTAuthentication,
+    }
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        kind = validated_token.get("role")
+        authenticator_class = self.principal_authenticators.get(kind)
+        if authenticator_class is None:
+            raise exceptions.AuthenticationFailed("Unknown token role")
+
+        user = authenticator_class().get_user(validated_token)
+        attach_principal(request, kind, user, validated_token)
+        return user, validated_token
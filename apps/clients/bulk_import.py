@@ -0,0 +1,203 @@
+"""
+Bulk client-user import (CSV / NDJSON).
+
+Pipeline: har row ka shape validate -> file ke andar aur `client_users`
+ke against duplicate emails ek query mein -> passwords process pool par
+parallel hash -> chunks mein bulk_create. Har galat row ka error
+(row number ke saath) report hota hai, baaki rows import ho jati hain.
+"""
+import atexit
+import csv
+import io
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from .models import ClientRole, ClientUser
+from .serializers import ClientUserImportRowSerializer
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+_config = getattr(settings, "CLIENT_USER_IMPORT", {})
+MAX_ROWS = _config.get("MAX_ROWS", 10_000)
+CHUNK_SIZE = _config.get("CHUNK_SIZE", 1000)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class ImportFileError(ValueError):
+    """Poori file hi reject (format / size), row-level error nahi."""
+
+
+def _get_executor():
+    """
+    Import ka apna pool (login hashing wala bounded executor bulk jobs se
+    bhar kar 503 na de). "spawn": threaded / async web worker ko fork karna
+    deadlock kar sakta hai; spawned child django.setup() se settings load
+    karta hai (DJANGO_SETTINGS_MODULE env se).
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=_config.get("MAX_WORKERS"),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+        return _executor
+
+
+def shutdown_executor():
+    """Pool band karo (worker recycle / command khatam); agla import naya bana leta hai."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_executor)
+
+
+def read_rows(stream, file_format):
+    """
+    (row_number, dict) list. CSV mein row 1 header hai, data row 2 se.
+    """
+    if file_format not in IMPORT_FORMATS:
+        raise ImportFileError(f"Choose one of: {', '.join(IMPORT_FORMATS)}.")
+
+    # Upload binary hota hai, management command text file deta hai
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="") if isinstance(stream.read(0), bytes) else stream
+    rows = []
+    if file_format == "csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            # Khaali cells = field diya hi nahi (optional fields ke liye)
+            rows.append((reader.line_num, {
+                key: value for key, value in row.items() if key is not None and value not in ("", None)
+            }))
+            if len(rows) > MAX_ROWS:
+                break
+    else:
+        for number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            rows.append((number, row if isinstance(row, dict) else None))
+            if len(rows) > MAX_ROWS:
+                break
+
+    if len(rows) > MAX_ROWS:
+        raise ImportFileError(f"At most {MAX_ROWS} rows per import.")
+    return rows
+
+
+def _existing_emails(emails):
+    # Login lookup bhi case-insensitive hai, is liye yahan bhi Lower(email)
+    return set(
+        ClientUser.objects.annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=emails)
+        .values_list("email_lower", flat=True)
+    )
+
+
+def _insert_chunk(users, row_numbers, errors):
+    """
+    Concurrent import ne beech mein wahi email bana di ho to IntegrityError:
+    chunk rollback, conflicting rows error mein, baaki dobara insert.
+    """
+    try:
+        with transaction.atomic():
+            ClientUser.objects.bulk_create(users)
+        return len(users)
+    except IntegrityError:
+        taken = _existing_emails([user.email.lower() for user in users])
+        remaining = []
+        for user, number in zip(users, row_numbers):
+            if user.email.lower() in taken:
+                errors.append({"row": number, "errors": {"email": ["A user with this email already exists."]}})
+            else:
+                remaining.append(user)
+        if len(remaining) == len(users):
+            raise
+        with transaction.atomic():
+            ClientUser.objects.bulk_create(remaining)
+        return len(remaining)
+
+
+def import_client_users(client, rows, chunk_size=CHUNK_SIZE):
+    """
+    `rows` read_rows() ka output. {"created", "failed", "errors"} return karta hai.
+    """
+    errors = []
+    valid = []
+    seen = set()
+    for number, row in rows:
+        if row is None:
+            errors.append({"row": number, "errors": {"non_field_errors": ["Row is not a JSON object."]}})
+            continue
+        serializer = ClientUserImportRowSerializer(data=row)
+        if not serializer.is_valid():
+            errors.append({"row": number, "errors": serializer.errors})
+            continue
+        data = serializer.validated_data
+        email = data["email"].lower()
+        if email in seen:
+            errors.append({"row": number, "errors": {"email": ["Duplicate email in this file."]}})
+            continue
+        seen.add(email)
+        valid.append((number, data))
+
+    taken = _existing_emails(list(seen)) if seen else set()
+    role_ids = {data["role"] for _, data in valid if data.get("role")}
+    known_roles = set(
+        ClientRole.objects.filter(role_id__in=role_ids).values_list("role_id", flat=True)
+    ) if role_ids else set()
+
+    accepted = []
+    for number, data in valid:
+        if data["email"].lower() in taken:
+            errors.append({"row": number, "errors": {"email": ["A user with this email already exists."]}})
+        elif data.get("role") and data["role"] not in known_roles:
+            errors.append({"row": number, "errors": {"role": ["Role not found."]}})
+        else:
+            accepted.append((number, data))
+
+    created = 0
+    if accepted:
+        # Sab se mehnga step: CPU-bound hashing, cores par parallel
+        hashes = _get_executor().map(
+            hashers.make_password,
+            [data["password"] for _, data in accepted],
+            chunksize=max(1, len(accepted) // 64),
+        )
+        users = [
+            ClientUser(
+                client=client,
+                role_id=data.get("role"),
+                email=data["email"],
+                password_hash=password_hash,
+                full_name=data["full_name"],
+                phone=data.get("phone") or None,
+            )
+            for (_, data), password_hash in zip(accepted, hashes)
+        ]
+        numbers = [number for number, _ in accepted]
+        for start in range(0, len(users), chunk_size):
+            created += _insert_chunk(
+                users[start:start + chunk_size], numbers[start:start + chunk_size], errors
+            )
+
+    errors.sort(key=lambda error: error["row"])
+    return {"created": created, "failed": len(errors), "errors": errors}
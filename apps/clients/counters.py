@@ -0,0 +1,7 @@
+from apps.core.counters import register_counter
+
+from .models import ClientRequest
+
+PENDING_CLIENT_REQUESTS = "client_requests.pending"
+
+register_counter(PENDING_CLIENT_REQUESTS, lambda: ClientRequest.objects.filter(request_status="pending"))
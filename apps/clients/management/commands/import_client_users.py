@@ -0,0 +1,47 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.clients.bulk_import import (
+    IMPORT_FORMATS, CHUNK_SIZE, ImportFileError, import_client_users, read_rows, shutdown_executor,
+)
+from apps.clients.models import Client
+
+
+class Command(BaseCommand):
+    help = "CSV / NDJSON file se ek client ke staff users bulk import karo."
+
+    def add_arguments(self, parser):
+        parser.add_argument("client_id", type=int)
+        parser.add_argument("path")
+        parser.add_argument("--file-format", choices=IMPORT_FORMATS, help="Default: file extension se")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            client = Client.objects.get(pk=options["client_id"])
+        except Client.DoesNotExist:
+            raise CommandError(f"Client {options['client_id']} not found")
+
+        path = options["path"]
+        file_format = options["file_format"] or path.rsplit(".", 1)[-1].lower()
+        start = time.perf_counter()
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as stream:
+                rows = read_rows(stream, file_format)
+        except ImportFileError as exc:
+            raise CommandError(str(exc))
+
+        try:
+            report = import_client_users(client, rows, chunk_size=options["chunk_size"])
+        finally:
+            shutdown_executor()
+        elapsed = time.perf_counter() - start
+
+        for error in report["errors"]:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(
+            f"Created {report['created']}, failed {report['failed']} "
+            f"in {elapsed:.2f}s ({report['created'] / elapsed:,.0f} users/s)"
+        )
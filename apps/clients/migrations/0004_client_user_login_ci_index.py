@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_client_token_version_clientuser_token_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clientuser',
+            index=models.Index(django.db.models.functions.text.Lower('email'), condition=models.Q(('is_active', True)), name='client_user_email_ci_act_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_client_user_login_ci_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clientrequest',
+            index=models.Index(fields=['-created_at', '-id'], name='client_req_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientuser',
+            index=models.Index(fields=['client', '-created_at', '-id'], name='client_user_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.9 on 2026-10-18 15:10
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0005_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='clientrequest',
+            index=models.Index(fields=['request_status', '-created_at', '-id'], name='client_req_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientrequest',
+            index=models.Index(fields=['industry_type', '-created_at', '-id'], name='client_req_industry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientrequest',
+            index=models.Index(fields=['company_size', '-created_at', '-id'], name='client_req_size_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientrequest',
+            index=models.Index(condition=models.Q(('request_status', 'pending')), fields=['-created_at', '-id'], name='client_req_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('company_name'), name='gin_trgm_ops'), name='client_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('company_email'), name='gin_trgm_ops'), name='client_email_trgm_idx'),
+        ),
+    ]
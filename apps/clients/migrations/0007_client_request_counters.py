@@ -0,0 +1,54 @@
+# Generated by Django 5.2.9 on 2026-10-18 15:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0006_client_request_filter_indexes'),
+        ('core', '0002_counter'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION client_requests_counters() RETURNS trigger AS $$
+                DECLARE
+                    pending_delta bigint := 0;
+                BEGIN
+                    -- NEW / OLD sirf unke TG_OP mein assigned hote hain, is liye nested IF
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        IF NEW.request_status = 'pending' THEN
+                            pending_delta := pending_delta + 1;
+                        END IF;
+                    END IF;
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        IF OLD.request_status = 'pending' THEN
+                            pending_delta := pending_delta - 1;
+                        END IF;
+                    END IF;
+
+                    IF pending_delta <> 0 THEN
+                        PERFORM bump_counter('client_requests.pending', pending_delta);
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER client_requests_counters
+                    AFTER INSERT OR DELETE OR UPDATE OF request_status ON clients_requests
+                    FOR EACH ROW EXECUTE FUNCTION client_requests_counters();
+
+                INSERT INTO counters (key, value, updated_at)
+                    SELECT 'client_requests.pending', COUNT(*), now()
+                    FROM clients_requests WHERE request_status = 'pending'
+                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = now();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS client_requests_counters ON clients_requests;
+                DROP FUNCTION IF EXISTS client_requests_counters();
+                DELETE FROM counters WHERE key = 'client_requests.pending';
+            """,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0007_client_request_counters'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='clientuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='client_user_email_ci_uniq'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0008_client_user_email_ci_unique'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='clientuser',
+            name='client_user_email_ci_act_idx',
+        ),
+    ]
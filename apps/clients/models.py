@@ -1,7 +1,16 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower, Upper
 from django.utils import timezone
 
-class TimeStampedModel(models.Model):
+from apps.core.dirty_fields import DirtyFieldsMixin
+
+class TimeStampedModel(DirtyFieldsMixin, models.Model):
+    """
+    created_at / updated_at; bare save() sirf badli hui fields likhta hai
+    (apps.core.dirty_fields).
+    """
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -28,6 +37,19 @@ class ClientRequest(TimeStampedModel):
 
     class Meta:
         db_table = "clients_requests"
+        indexes = [
+            # Keyset pagination (created_at, id)
+            models.Index(fields=["-created_at", "-id"], name="client_req_created_id_idx"),
+            # Admin triage filters (apps/administrators/filters.py)
+            models.Index(fields=["request_status", "-created_at", "-id"], name="client_req_status_idx"),
+            models.Index(fields=["industry_type", "-created_at", "-id"], name="client_req_industry_idx"),
+            models.Index(fields=["company_size", "-created_at", "-id"], name="client_req_size_idx"),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="client_req_pending_idx",
+                condition=Q(request_status="pending"),
+            ),
+        ]
 
     def __str__(self):
         return f"Request #{self.id} - Client {self.client.company_name}"
@@ -46,13 +68,22 @@ class Client(TimeStampedModel):
     is_verified = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     last_login = models.DateTimeField(blank=True, null=True)
+    token_version = models.PositiveIntegerField(default=0)
 
     class Meta:
         db_table = "clients"
+        indexes = [
+            # Client-request search: icontains -> UPPER(col) LIKE '%term%'
+            GinIndex(OpClass(Upper("company_name"), name="gin_trgm_ops"), name="client_name_trgm_idx"),
+            GinIndex(OpClass(Upper("company_email"), name="gin_trgm_ops"), name="client_email_trgm_idx"),
+        ]
 
     def __str__(self):
         return self.company_name
 
+    def bump_token_version(self):
+        self.token_version += 1
+
     @property
     def is_authenticated(self):
         # This makes DRF happy for permission checks
@@ -80,9 +111,22 @@ class ClientUser(TimeStampedModel):
     phone = models.CharField(max_length=20, blank=True, null=True)
     is_active = models.BooleanField(default=True)
     last_login = models.DateTimeField(blank=True, null=True)
+    token_version = models.PositiveIntegerField(default=0)
 
     class Meta:
         db_table = "client_users"
+        indexes = [
+            # Tenant-scoped keyset pagination
+            models.Index(fields=["client", "-created_at", "-id"], name="client_user_created_id_idx"),
+        ]
+        constraints = [
+            # Login case-insensitive hai, is liye case-variant duplicates bhi nahi;
+            # staff login lookup (utils.authenticate_client_user) bhi isi index par
+            models.UniqueConstraint(Lower("email"), name="client_user_email_ci_uniq"),
+        ]
 
     def __str__(self):
         return self.email
+
+    def bump_token_version(self):
+        self.token_version += 1
@@ -0,0 +1,32 @@
+from rest_framework.permissions import BasePermission
+from apps.core.principal import get_principal
+
+
+class IsCompanyOwner(BasePermission):
+    """
+    Allow access only to the company owner (Client token).
+    """
+
+    def has_permission(self, request, view):
+        principal = get_principal(request)
+        return principal is not None and principal.is_client
+
+
+class IsClientMember(BasePermission):
+    """
+    Company owner ya staff, dono allowed (administrator nahi).
+    """
+
+    def has_permission(self, request, view):
+        principal = get_principal(request)
+        return principal is not None and principal.client_id is not None
+
+
+class IsClientStaff(BasePermission):
+    """
+    Allow access only to company staff (ClientUser token).
+    """
+
+    def has_permission(self, request, view):
+        principal = get_principal(request)
+        return principal is not None and principal.is_client_user
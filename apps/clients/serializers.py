@@ -0,0 +1,131 @@
+from rest_framework import serializers
+
+from apps.core.hashing import password_hashing
+from .models import Client, ClientRequest, ClientRole, ClientUser
+
+
+class ClientSignupSerializer(serializers.ModelSerializer):
+    """
+    Company owner signup. Password hashing pool par hoti hai.
+    """
+    password = serializers.CharField(write_only=True, min_length=8)
+
+    class Meta:
+        model = Client
+        fields = (
+            "id", "company_name", "company_email", "password",
+            "company_phone", "company_website", "industry_type", "company_size"
+        )
+        read_only_fields = ("id",)
+
+    def validate_company_email(self, value):
+        if Client.objects.filter(company_email__iexact=value).exists():
+            raise serializers.ValidationError("A client with this email already exists.")
+        return value
+
+    def create(self, validated_data):
+        validated_data["password_hash"] = password_hashing.make_password(validated_data.pop("password"))
+        return super().create(validated_data)
+
+
+class ClientRequestSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ClientRequest
+        fields = (
+            "id", "client", "company_phone", "company_website",
+            "industry_type", "company_size", "request_status",
+            "approved_by_administrator", "approved_at", "created_at", "updated_at"
+        )
+        read_only_fields = (
+            "id", "client", "request_status", "approved_by_administrator",
+            "approved_at", "created_at", "updated_at"
+        )
+
+
+class ClientProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Client
+        fields = (
+            "id", "company_name", "company_email", "company_phone",
+            "company_website", "industry_type", "company_size", "company_logo",
+            "is_verified", "is_active", "last_login", "created_at", "updated_at"
+        )
+        read_only_fields = (
+            "id", "company_email", "is_verified", "is_active",
+            "last_login", "created_at", "updated_at"
+        )
+
+
+class ClientRoleSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ClientRole
+        fields = ("role_id", "role_name", "status", "created_at", "updated_at")
+        read_only_fields = ("role_id", "created_at", "updated_at")
+
+
+class ClientUserSerializer(serializers.ModelSerializer):
+    password = serializers.CharField(write_only=True, min_length=8)
+
+    class Meta:
+        model = ClientUser
+        fields = (
+            "id", "client", "role", "email", "password", "full_name",
+            "phone", "is_active", "last_login", "created_at", "updated_at"
+        )
+        read_only_fields = ("id", "client", "is_active", "last_login", "created_at", "updated_at")
+
+    def validate_email(self, value):
+        # Case-insensitive (login bhi Lower(email) par hai)
+        queryset = ClientUser.objects.filter(email__iexact=value)
+        if self.instance is not None:
+            queryset = queryset.exclude(pk=self.instance.pk)
+        if queryset.exists():
+            raise serializers.ValidationError("A user with this email already exists.")
+        return value
+
+    def create(self, validated_data):
+        validated_data["password_hash"] = password_hashing.make_password(validated_data.pop("password"))
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        password = validated_data.pop("password", None)
+        if password:
+            instance.password_hash = password_hashing.make_password(password)
+            instance.bump_token_version()
+        return super().update(instance, validated_data)
+
+
+class ClientUserPasswordResetSerializer(serializers.Serializer):
+    """
+    Company owner apne staff user ka password reset karta hai.
+    """
+    client_user_id = serializers.IntegerField()
+    new_password = serializers.CharField(write_only=True, min_length=8)
+
+    def validate_client_user_id(self, value):
+        request = self.context.get("request")
+        queryset = ClientUser.objects.filter(id=value)
+        if request is not None:
+            queryset = queryset.filter(client=request.user)
+        if not queryset.exists():
+            raise serializers.ValidationError("Client user not found.")
+        return value
+
+    def save(self):
+        user = ClientUser.objects.get(id=self.validated_data["client_user_id"])
+        user.password_hash = password_hashing.make_password(self.validated_data["new_password"])
+        user.bump_token_version()
+        user.save()
+        return user
+
+
+class ClientUserImportRowSerializer(serializers.Serializer):
+    """
+    Bulk import ki ek row. ModelSerializer nahi: email uniqueness har row
+    par query ki bajaye bulk_import mein ek set-based query se check hoti hai.
+    """
+    email = serializers.EmailField(max_length=254)
+    password = serializers.CharField(write_only=True, min_length=8)
+    full_name = serializers.CharField(max_length=255)
+    phone = serializers.CharField(max_length=20, required=False, allow_blank=True, allow_null=True)
+    role = serializers.IntegerField(required=False, allow_null=True, min_value=1)
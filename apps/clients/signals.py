@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.principal_cache import principal_cache
+from apps.core.response_cache import bump_table_version
+from .models import Client, ClientRequest, ClientUser
+
+
+@receiver([post_save, post_delete], sender=Client)
+def invalidate_client_principal(sender, instance, **kwargs):
+    principal_cache.invalidate("client", instance.pk)
+    # Client-request search company_name / company_email par bhi hota hai
+    bump_table_version(Client)
+
+
+@receiver([post_save, post_delete], sender=ClientUser)
+def invalidate_client_user_principal(sender, instance, **kwargs):
+    principal_cache.invalidate("client_user", instance.pk)
+
+
+@receiver([post_save, post_delete], sender=ClientRequest)
+def bump_client_request_version(sender, instance, **kwargs):
+    # Admin client-request list ka response cache invalidate
+    bump_table_version(ClientRequest)
@@ -1,3 +1,201 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.hashers import check_password
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.core.compiled_serializers import compile_serializer
+from apps.core.models import IdempotencyKey
+from apps.core.testing import ConstantQueryCountMixin
+from .bulk_import import shutdown_executor
+from .models import Client, ClientRequest, ClientRole, ClientUser
+from .serializers import ClientRequestSerializer, ClientUserSerializer
+from .utils import get_tokens_for_client
+
+
+def create_company(email="owner@acme.test"):
+    return Client.objects.create(company_name="Acme", company_email=email, password_hash="!")
+
+
+class ClientUserListQueryCountTests(ConstantQueryCountMixin, TestCase):
+    def setUp(self):
+        self.company = create_company()
+        self.role = ClientRole.objects.create(role_name="Staff")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_client(self.company)['access']}")
+        self.counter = 0
+
+    def make_users(self, n):
+        start = self.counter
+        self.counter += n
+        ClientUser.objects.bulk_create([
+            ClientUser(
+                client=self.company, role=self.role, email=f"user{i}@acme.test",
+                password_hash="!", full_name=f"User {i}",
+            )
+            for i in range(start, self.counter)
+        ])
+
+    def test_client_user_list(self):
+        self.assertConstantQueryCount(self.make_users, lambda: self.client.get("/api/client/users/"))
+
+
+class CompiledSerializerTests(TestCase):
+    """
+    Compiled values_list path ka output stock ModelSerializer se byte-identical.
+    """
+
+    def setUp(self):
+        company = create_company()
+        other = create_company(email="other@acme.test")
+        role = ClientRole.objects.create(role_name="Staff")
+        ClientRequest.objects.create(client=company, company_phone="123", industry_type="IT", company_size="1-10")
+        ClientRequest.objects.create(
+            client=other, company_phone="456", company_website="https://acme.test", industry_type="Retail",
+            company_size="11-50", request_status="approved", approved_at=timezone.now(),
+        )
+        ClientUser.objects.create(client=company, role=role, email="a@acme.test", password_hash="!", full_name="A")
+        ClientUser.objects.create(
+            client=company, role=None, email="b@acme.test", password_hash="!", full_name="B", phone="555",
+            is_active=False, last_login=timezone.now(),
+        )
+
+    def assertByteIdentical(self, model, serializer_class):
+        compiled = compile_serializer(serializer_class)
+        self.assertIsNotNone(compiled, f"{serializer_class.__name__} should compile")
+        queryset = model.objects.order_by("-created_at", "-pk")
+        stock = JSONRenderer().render(serializer_class(queryset, many=True).data)
+        fast = JSONRenderer().render(compiled.render(queryset.values_list(*compiled.columns)))
+        self.assertEqual(stock, fast)
+
+    def test_client_request_serializer(self):
+        self.assertByteIdentical(ClientRequest, ClientRequestSerializer)
+
+    def test_client_user_serializer(self):
+        self.assertByteIdentical(ClientUser, ClientUserSerializer)
+
+
+IMPORT_CSV = (
+    "email,password,full_name,phone,role\n"
+    "new.one@acme.test,long-enough-1,New One,555,\n"
+    "NEW.ONE@acme.test,long-enough-2,Same Email,,\n"
+    "Existing@ACME.test,long-enough-3,Already There,,\n"
+    "short@acme.test,short,Short Password,,\n"
+    "new.two@acme.test,long-enough-4,New Two,,\n"
+)
+
+
+class ClientUserImportTests(TestCase):
+    def setUp(self):
+        self.company = create_company()
+        ClientUser.objects.create(
+            client=self.company, email="existing@acme.test", password_hash="!", full_name="Existing"
+        )
+        self.addCleanup(shutdown_executor)
+
+    def assertImported(self, report):
+        self.assertEqual(report["created"], 2)
+        self.assertEqual([error["row"] for error in report["errors"]], [3, 4, 5])
+        self.assertEqual(
+            set(ClientUser.objects.filter(client=self.company).values_list("email", flat=True)),
+            {"existing@acme.test", "new.one@acme.test", "new.two@acme.test"},
+        )
+        user = ClientUser.objects.get(email="new.one@acme.test")
+        self.assertEqual(user.phone, "555")
+        self.assertTrue(check_password("long-enough-1", user.password_hash))
+
+    def test_endpoint_imports_csv_file(self):
+        api = APIClient()
+        api.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_client(self.company)['access']}")
+        upload = SimpleUploadedFile("users.csv", IMPORT_CSV.encode(), content_type="text/csv")
+        response = api.post("/api/client/users/bulk-import/", {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 201)
+        self.assertImported(response.data)
+
+    def test_command_imports_csv_file(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as handle:
+            handle.write(IMPORT_CSV)
+        self.addCleanup(os.remove, handle.name)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command("import_client_users", str(self.company.pk), handle.name, stdout=stdout, stderr=stderr)
+        self.assertIn("Created 2, failed 3", stdout.getvalue())
+        self.assertEqual(len(stderr.getvalue().splitlines()), 3)
+        self.assertImported({
+            "created": 2,
+            "errors": [{"row": int(line.split()[1].rstrip(":"))} for line in stderr.getvalue().splitlines()],
+        })
+
+
+class ClientUserToggleStatusTests(TestCase):
+    def setUp(self):
+        self.company = create_company()
+        self.other = create_company(email="owner@other.test")
+        self.user = ClientUser.objects.create(client=self.company, email="a@acme.test", password_hash="!", full_name="A")
+        self.foreign = ClientUser.objects.create(client=self.other, email="b@other.test", password_hash="!", full_name="B")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {get_tokens_for_client(self.company)['access']}")
+
+    def toggle(self, pk, body=None):
+        return self.client.patch(f"/api/client/users/{pk}/toggle-status/", body or {}, format="json")
+
+    def test_flip_and_explicit_target(self):
+        self.assertIs(self.toggle(self.user.pk).data["is_active"], False)
+        self.assertIs(self.toggle(self.user.pk, {"is_active": True}).data["is_active"], True)
+        self.assertIs(self.toggle(self.user.pk, {"is_active": True}).data["is_active"], True)
+
+    def test_other_company_user_is_404_and_untouched(self):
+        self.assertEqual(self.toggle(self.foreign.pk).status_code, 404)
+        self.foreign.refresh_from_db()
+        self.assertTrue(self.foreign.is_active)
+        self.assertEqual(self.toggle("abc").status_code, 404)
+
+
+class SignupIdempotencyTests(TestCase):
+    url = "/api/client/signup/"
+
+    def signup(self, key, email="new@acme.test"):
+        body = json.dumps({
+            "company_name": "Acme", "company_email": email, "password": "long-enough-1",
+            "company_phone": "123", "industry_type": "IT", "company_size": "11-50",
+        })
+        response = self.client.post(
+            self.url, data=body, content_type="application/json", HTTP_IDEMPOTENCY_KEY=key
+        )
+        return response, body
+
+    def test_retry_replays_stored_response(self):
+        first, _ = self.signup("key-1")
+        self.assertEqual(first.status_code, 201)
+        second, _ = self.signup("key-1")
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(Client.objects.filter(company_email="new@acme.test").count(), 1)
+
+    def test_same_key_different_body_is_422(self):
+        self.signup("key-1")
+        response, _ = self.signup("key-1", email="other@acme.test")
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(Client.objects.filter(company_email="other@acme.test").exists())
 
-# Create your tests here.
+    def test_in_flight_duplicate_is_409(self):
+        body = self.signup("key-0")[1]
+        digest = hashlib.sha256(f"POST {self.url}\n".encode() + body.encode()).hexdigest()
+        IdempotencyKey.objects.create(
+            scope="client-signup", key="key-2", fingerprint=digest,
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+        with mock.patch("apps.core.idempotency.WAIT_TIMEOUT", 0.2):
+            response, _ = self.signup("key-2")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Client.objects.filter(company_email="new@acme.test").count(), 1)
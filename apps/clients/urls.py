@@ -8,8 +8,10 @@ from .views import (
     ClientRoleCreateAPIView,
     ClientUserPasswordResetAPIView,
     ClientUserViewSet,
-    ClientUserLoginAPIView
+    ClientUserLoginAPIView,
+    ClientLogoutAPIView
 )
+from .async_views import client_signup_async, client_login_async, client_user_login_async
 
 # Router setup for ViewSets
 router = DefaultRouter()
@@ -19,6 +21,10 @@ urlpatterns = [
     # Auth Endpoints
     path("signup/", ClientSignupAPIView.as_view(), name="client-signup"),
     path("login/", ClientLoginAPIView.as_view(), name="client-login"),
+    # Native async variants (ASGI par hashing worker ko block nahi karti)
+    path("signup/async/", client_signup_async, name="client-signup-async"),
+    path("login/async/", client_login_async, name="client-login-async"),
+    path("logout/", ClientLogoutAPIView.as_view(), name="client-logout"),
     
     # Onboarding & Profile
     path("request/", ClientRequestCreateAPIView.as_view(), name="client-request"),
@@ -26,6 +32,7 @@ urlpatterns = [
     
     path("role/create/", ClientRoleCreateAPIView.as_view(), name="client-role-create"),
     path("client-user/login/", ClientUserLoginAPIView.as_view(), name="client-user-login"),
+    path("client-user/login/async/", client_user_login_async, name="client-user-login-async"),
     path("client-user/password-reset/", ClientUserPasswordResetAPIView.as_view(), name="client-user-password-reset"),
     
     # Router URLs ( automatic /users/ list aur /users/ create)
@@ -0,0 +1,109 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.db.models.functions import Lower
+from apps.administrators.utils import normalize_login_identifier
+from apps.core.hashing import apersist_rehash, password_hashing, persist_rehash
+from .models import Client, ClientUser
+
+
+def get_tokens_for_client(client):
+    """
+    Generate JWT refresh and access tokens for Client (company owner)
+    with custom claims: client_id, role and token_version
+    """
+    refresh = RefreshToken.for_user(client)
+    refresh["client_id"] = client.id
+    refresh["role"] = "client"
+    refresh["token_version"] = client.token_version
+
+    return {
+        "refresh": str(refresh),
+        "access": str(refresh.access_token),
+    }
+
+
+def get_tokens_for_client_user(client_user):
+    """
+    Generate JWT tokens for ClientUser (company staff)
+    """
+    refresh = RefreshToken.for_user(client_user)
+    refresh["client_user_id"] = client_user.id
+    refresh["client_id"] = client_user.client_id
+    refresh["role"] = "client_user"
+    refresh["token_version"] = client_user.token_version
+
+    return {
+        "refresh": str(refresh),
+        "access": str(refresh.access_token),
+    }
+
+
+def authenticate_client(email, password):
+    """
+    Authenticate Client by company email
+    """
+    try:
+        client = Client.objects.get(company_email=email, is_active=True) if isinstance(email, str) else None
+    except Client.DoesNotExist:
+        client = None
+
+    encoded = client.password_hash if client else None
+    matched, rehashed = password_hashing.verify(password, encoded)
+    if matched:
+        persist_rehash(client, rehashed)
+        return client
+
+    return None
+
+
+async def aauthenticate_client(email, password):
+    try:
+        client = await Client.objects.aget(company_email=email, is_active=True) if isinstance(email, str) else None
+    except Client.DoesNotExist:
+        client = None
+
+    encoded = client.password_hash if client else None
+    matched, rehashed = await password_hashing.averify(password, encoded)
+    if matched:
+        await apersist_rehash(client, rehashed)
+        return client
+
+    return None
+
+
+def _client_user_login_queryset(identifier):
+    """
+    Case-insensitive email lookup, partial functional index
+    (lower(email) WHERE is_active) par single probe.
+    """
+    return ClientUser.objects.select_related("role").alias(
+        email_ci=Lower("email")
+    ).filter(email_ci=identifier, is_active=True).order_by("id")
+
+
+def authenticate_client_user(identifier, password):
+    """
+    Authenticate ClientUser by email (case-insensitive)
+    """
+    identifier = normalize_login_identifier(identifier)
+    user = _client_user_login_queryset(identifier).first() if identifier else None
+
+    encoded = user.password_hash if user else None
+    matched, rehashed = password_hashing.verify(password, encoded)
+    if matched:
+        persist_rehash(user, rehashed)
+        return user
+
+    return None
+
+
+async def aauthenticate_client_user(identifier, password):
+    identifier = normalize_login_identifier(identifier)
+    user = await _client_user_login_queryset(identifier).afirst() if identifier else None
+
+    encoded = user.password_hash if user else None
+    matched, rehashed = await password_hashing.averify(password, encoded)
+    if matched:
+        await apersist_rehash(user, rehashed)
+        return user
+
+    return None
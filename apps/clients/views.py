@@ -1,3 +1,4 @@
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -19,13 +20,26 @@ from .serializers import (
 from .utils import authenticate_client, get_tokens_for_client
 from .utils import authenticate_client_user, get_tokens_for_client_user
 
-from .authentication import ClientJWTAuthentication, ClientUserJWTAuthentication
-from .permissions import IsCompanyOwner
+from .authentication import ClientJWTAuthentication, ClientPrincipalJWTAuthentication
+from .permissions import IsClientMember, IsCompanyOwner
+from .bulk_import import ImportFileError, import_client_users, read_rows
+from apps.core.last_seen import last_seen_buffer
+from apps.core.logout import BaseLogoutAPIView
+from apps.core.pagination import KeysetPagination
+from apps.core.compiled_serializers import CompiledListMixin
+from apps.core.conditional import conditional_response
+from apps.core.exports import get_export_format, stream_export
+from apps.core.fieldsets import sparse_serializer_class
+from apps.core.idempotency import idempotent
+from apps.core.query_planning import QueryPlanningMixin
+from apps.core.status_toggle import StatusToggleSerializer, set_active_state
+from apps.core.throttling import LoginRateThrottle
 
  
 class ClientSignupAPIView(APIView):
     permission_classes = [AllowAny]
 
+    @idempotent("client-signup")
     def post(self, request):
         serializer = ClientSignupSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -37,6 +51,9 @@ class ClientSignupAPIView(APIView):
 
 class ClientLoginAPIView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [LoginRateThrottle]
+    login_identifier_field = "company_email"
+    login_throttle_scope = "client-login"
 
     def post(self, request):
         email = request.data.get("company_email")
@@ -45,14 +62,21 @@ class ClientLoginAPIView(APIView):
         if not client:
             return Response({"error": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
 
+        last_seen_buffer.record(Client, client.pk, "last_login")
         tokens = get_tokens_for_client(client)
         return Response({"tokens": tokens}, status=status.HTTP_200_OK)
 
  
+class ClientLogoutAPIView(BaseLogoutAPIView):
+    authentication_classes = [ClientPrincipalJWTAuthentication]
+    permission_classes = [IsClientMember]
+
+
 class ClientRequestCreateAPIView(APIView):
     authentication_classes = [ClientJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
+    @idempotent("client-request-create")
     def post(self, request):
         if ClientRequest.objects.filter(client=request.user).exists():
             return Response({"error": "Request already submitted"}, status=status.HTTP_400_BAD_REQUEST)
@@ -66,16 +90,24 @@ class ClientRequestCreateAPIView(APIView):
  
 class ClientProfileAPIView(APIView):
      
-    authentication_classes = [ClientJWTAuthentication, ClientUserJWTAuthentication]
-    permission_classes = [IsAuthenticated]
+    authentication_classes = [ClientPrincipalJWTAuthentication]
+    permission_classes = [IsClientMember]
 
     def get(self, request):
-        client = request.user.client if hasattr(request.user, 'client') else request.user
-        serializer = ClientProfileSerializer(client)
-        return Response(serializer.data)
+        principal = request.principal
+
+        def render(updated_at):
+            if principal.is_client and principal.instance.updated_at == updated_at:
+                client = principal.instance
+            else:
+                client = get_object_or_404(Client, pk=principal.client_id)
+            return Response(ClientProfileSerializer(client).data)
+
+        # ETag / If-None-Match / If-Modified-Since: unchanged profile par 304
+        return conditional_response(request, Client, principal.client_id, render)
 
     def patch(self, request):
-        if not hasattr(request.user, 'company_email'):
+        if not request.principal.is_client:
              return Response({"detail": "Only company owner can update profile"}, status=status.HTTP_403_FORBIDDEN)
         
         serializer = ClientProfileSerializer(request.user, data=request.data, partial=True)
@@ -84,34 +116,68 @@ class ClientProfileAPIView(APIView):
         return Response(serializer.data)
 
  
-class ClientUserViewSet(viewsets.ModelViewSet):
+class ClientUserViewSet(CompiledListMixin, QueryPlanningMixin, viewsets.ModelViewSet):
     """
     Handles List, Create, Retrieve, Update, Delete and Custom Actions for Staff.
     """
     serializer_class = ClientUserSerializer
-    authentication_classes = [ClientJWTAuthentication, ClientUserJWTAuthentication]
+    authentication_classes = [ClientPrincipalJWTAuthentication]
+    pagination_class = KeysetPagination
 
     def get_permissions(self):
-        if self.action in ['create', 'toggle_status', 'destroy']:
+        if self.action in ['create', 'bulk_import', 'toggle_status', 'destroy']:
             return [IsCompanyOwner()]
-        return [IsAuthenticated()]
+        return [IsClientMember()]
+
+    def get_serializer_class(self):
+        # ?fields= / ?exclude= (sirf GET par)
+        return sparse_serializer_class(self.serializer_class, self.request)
 
     def get_queryset(self):
         # Security: Filter users belonging to the logged-in client's company
-        user = self.request.user
-        client_obj = user.client if hasattr(user, 'client') else user
-        return ClientUser.objects.filter(client=client_obj)
+        return ClientUser.objects.filter(client_id=self.request.principal.client_id)
 
     def perform_create(self, serializer):
         # Automatically link the new user to the logged-in client
         serializer.save(client=self.request.user)
 
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """Company ke staff ka streaming NDJSON / CSV export."""
+        export_format = get_export_format(request)
+        queryset = self.filter_queryset(self.get_queryset()).order_by("-created_at", "-id")
+        return stream_export(queryset, self.get_serializer_class(), export_format, "client_users")
+
+    @action(detail=False, methods=['post'], url_path='bulk-import')
+    def bulk_import(self, request):
+        """
+        Multipart `file` (CSV / NDJSON, ?file_format= ya file extension se).
+        Per-row errors ke saath report; valid rows import ho jati hain.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response({"error": "file is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        file_format = request.query_params.get("file_format") or upload.name.rsplit(".", 1)[-1]
+        try:
+            rows = read_rows(upload.file, file_format.lower())
+        except (ImportFileError, UnicodeDecodeError) as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        report = import_client_users(request.user, rows)
+        return Response(report, status=status.HTTP_201_CREATED if report["created"] else status.HTTP_400_BAD_REQUEST)
+
     @action(detail=True, methods=['patch'], url_path='toggle-status')
     def toggle_status(self, request, pk=None):
-        user = self.get_object()
-        user.is_active = not user.is_active
-        user.save()
-        return Response({"message": f"User {'activated' if user.is_active else 'deactivated'}"})
+        # Ek UPDATE, get_queryset() wala tenant scope; {"is_active": ...} optional
+        serializer = StatusToggleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        is_active = set_active_state(
+            self.get_queryset(), pk, serializer.validated_data["is_active"], principal_kind="client_user"
+        )
+        if is_active is None:
+            raise Http404
+        return Response({"message": f"User {'activated' if is_active else 'deactivated'}", "is_active": is_active})
 
  
 
@@ -131,7 +197,7 @@ class ClientUserPasswordResetAPIView(APIView):
     permission_classes = [IsAuthenticated, IsCompanyOwner]
 
     def post(self, request):
-        serializer = ClientUserPasswordResetSerializer(data=request.data)
+        serializer = ClientUserPasswordResetSerializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response({"message": "Client user password reset successfully"}, status=status.HTTP_200_OK)
@@ -139,6 +205,9 @@ class ClientUserPasswordResetAPIView(APIView):
 
 class ClientUserLoginAPIView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [LoginRateThrottle]
+    login_identifier_field = "email"
+    login_throttle_scope = "client-user-login"
 
     def post(self, request):
         identifier = request.data.get("email") # Identifier (Email)
@@ -152,6 +221,7 @@ class ClientUserLoginAPIView(APIView):
         if not user:
             return Response({"error": "Invalid staff credentials"}, status=status.HTTP_401_UNAUTHORIZED)
 
+        last_seen_buffer.record(ClientUser, user.pk, "last_login")
         tokens = get_tokens_for_client_user(user)
         return Response({
             "message": "Staff login successful",
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Warning
+
+
+def check_response_cache_alias(app_configs, **kwargs):
+    """
+    Response cache ki table versions process-local cache mein hon to ek
+    worker ka bump doosre workers ko nahi dikhta (apps.core.response_cache).
+    """
+    from .response_cache import is_process_local
+
+    alias = getattr(settings, "RESPONSE_CACHE", {}).get("ALIAS", "default")
+    if settings.DEBUG or not is_process_local(caches[alias]):
+        return []
+    return [
+        Warning(
+            f"RESPONSE_CACHE['ALIAS'] ({alias!r}) is a process-local LocMemCache.",
+            hint=(
+                "Table-version bumps will not reach other workers; cached lists are "
+                "capped at RESPONSE_CACHE['LOCAL_TIMEOUT']. Point ALIAS at a shared "
+                "cache (Redis / Memcached) for multi-worker deployments."
+            ),
+            id="core.W001",
+        )
+    ]
@@ -0,0 +1,152 @@
+"""
+Read-only fast path for hot list endpoints.
+
+Har serializer class ke liye ek dafa (column, formatter) ka flat tuple
+banta hai aur rows seedha `.values_list()` se render hoti hain: na model
+instances, na per-row field binding. Output stock DRF jaisa hi hai; jo
+field safely compile nahi hota (FileField, nested, method fields,
+custom to_representation) us serializer ke liye stock path use hota hai.
+"""
+import functools
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields, relations, serializers
+
+from .query_planning import optimize_queryset
+
+# Exact types: DB value hi representation hai
+IDENTITY_FIELDS = (
+    fields.CharField,
+    fields.EmailField,
+    fields.URLField,
+    fields.SlugField,
+    fields.IntegerField,
+    fields.BooleanField,
+    fields.ReadOnlyField,
+)
+
+# Exact types: bound field.to_representation(value) chahiye
+FORMATTED_FIELDS = (
+    fields.DateTimeField,
+    fields.DateField,
+    fields.TimeField,
+    fields.DecimalField,
+    fields.FloatField,
+    fields.UUIDField,
+)
+
+
+class CompiledReadSerializer:
+    def __init__(self, names, columns, formatters):
+        self.names = names
+        self.columns = columns
+        self.formatters = formatters
+        self._plan = tuple(zip(range(len(names)), names, formatters))
+
+    def render_row(self, row):
+        data = {}
+        for index, name, formatter in self._plan:
+            value = row[index]
+            if formatter is not None and value is not None:
+                value = formatter(value)
+            data[name] = value
+        return data
+
+    def render(self, rows):
+        render_row = self.render_row
+        return [render_row(row) for row in rows]
+
+
+def _source_is_column(model, source_attrs):
+    """
+    Source ek concrete column tak jata hai aur beech ke hops sirf non-null
+    forward FK hain. Nullable FK par DRF (required=False) key hi chhor deta
+    hai (SkipField) jabke values_list None deta, is liye woh compile nahi.
+    """
+    for attr in source_attrs[:-1]:
+        try:
+            hop = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return False
+        if not (hop.many_to_one or hop.one_to_one) or not hop.concrete or hop.null:
+            return False
+        model = hop.related_model
+    try:
+        return model._meta.get_field(source_attrs[-1]).concrete
+    except FieldDoesNotExist:
+        return False
+
+
+def _compile_field(field, model):
+    """
+    (column lookup, formatter) ya None agar field compile nahi ho sakta.
+    """
+    if not field.source_attrs or not _source_is_column(model, field.source_attrs):
+        return None
+    lookup = "__".join(field.source_attrs)
+    field_type = type(field)
+
+    if field_type in IDENTITY_FIELDS:
+        return lookup, None
+    if field_type in FORMATTED_FIELDS:
+        return lookup, field.to_representation
+    if field_type is relations.PrimaryKeyRelatedField and field.pk_field is None:
+        # values_list("role") FK ka pk deta hai, yehi DRF ka output hai
+        return lookup, None
+    return None
+
+
+def _compile(serializer_class):
+    if not issubclass(serializer_class, serializers.ModelSerializer):
+        return None
+    if serializer_class.to_representation is not serializers.ModelSerializer.to_representation:
+        return None
+
+    names, columns, formatters = [], [], []
+    for name, field in serializer_class().fields.items():
+        if field.write_only:
+            continue
+        compiled = _compile_field(field, serializer_class.Meta.model)
+        if compiled is None:
+            return None
+        names.append(name)
+        columns.append(compiled[0])
+        formatters.append(compiled[1])
+
+    return CompiledReadSerializer(tuple(names), tuple(columns), tuple(formatters))
+
+
+@functools.lru_cache(maxsize=512)
+def compile_serializer(serializer_class):
+    # Bounded: sparse fieldset classes bhi yahan compile hoti hain
+    return _compile(serializer_class)
+
+
+def paginated_list_response(paginator, queryset, serializer_class, request, view=None):
+    """
+    KeysetPagination ke saath list response: compiled path agar mumkin ho,
+    warna optimize_queryset + stock serializer.
+    """
+    compiled = compile_serializer(serializer_class)
+    if compiled is None:
+        page = paginator.paginate_queryset(optimize_queryset(queryset, serializer_class), request, view=view)
+        context = {"request": request, "view": view}
+        return paginator.get_paginated_response(serializer_class(page, many=True, context=context).data)
+
+    # Cursor ke liye raw created_at / pk aakhir mein
+    rows = queryset.values_list(*compiled.columns, "created_at", "pk")
+    page = paginator.paginate_values_list(rows, request, view=view)
+    return paginator.get_paginated_response(compiled.render(page))
+
+
+class CompiledListMixin:
+    """
+    ViewSet.list ko compiled read path par le jata hai (pagination_class
+    KeysetPagination honi chahiye).
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return paginated_list_response(
+            self.paginator, queryset, self.get_serializer_class(), request, view=self
+        )
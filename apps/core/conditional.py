@@ -0,0 +1,84 @@
+import hashlib
+import time
+
+from django.http import Http404
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def profile_etag(pk, stamps):
+    """
+    Strong ETag (id + validator timestamps) se. updated_at auto_now hai, is
+    liye har save par badalta hai; related tables (e.g. role) ke timestamps
+    bhi shamil hote hain kyunke unke fields bhi render hote hain.
+    """
+    parts = ":".join(stamp.isoformat() if stamp is not None else "-" for stamp in stamps)
+    digest = hashlib.blake2b(f"{pk}:{parts}".encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(header, etag):
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _settled(updated_at):
+    """
+    HTTP dates sirf seconds tak hain: jo second abhi chal raha hai us mein
+    doosri update bhi ho sakti hai, is liye us ka date validator reliable nahi.
+    """
+    return int(updated_at.timestamp()) < int(time.time())
+
+
+def is_not_modified(request, etag, updated_at):
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        # If-None-Match ho to If-Modified-Since ignore hota hai (RFC 9110 13.1.3)
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    if if_modified_since is not None and _settled(updated_at):
+        return int(updated_at.timestamp()) <= if_modified_since
+    return False
+
+
+def _with_validators(response, etag, updated_at):
+    response["ETag"] = etag
+    # Current second ka Last-Modified nahi bhejte: usi second ki agli update
+    # ke baad client ka If-Modified-Since galat 304 dilwa deta
+    if _settled(updated_at):
+        response["Last-Modified"] = http_date(updated_at.timestamp())
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def conditional_response(request, model, pk, render, validators=("updated_at",)):
+    """
+    Pehle sirf validator timestamps (pk lookup) parhe jate hain. Profile
+    change na hua ho to 304, na row load hoti hai na serializer chalta hai;
+    warna `render(updated_at)` se full Response.
+
+    `validators` mein har woh timestamp hona chahiye jis ka data render hota
+    hai: pehla apna `updated_at`, phir related rows (e.g. "role__updated_at").
+    Jo writes (bulk_update) save() se nahi guzarte unhein updated_at khud
+    set karna hai (dekhein apps.core.last_seen).
+    """
+    stamps = model.objects.filter(pk=pk).values_list(*validators).first()
+    if stamps is None:
+        raise Http404
+
+    updated_at = stamps[0]
+    last_modified = max(stamp for stamp in stamps if stamp is not None)
+    etag = profile_etag(pk, stamps)
+    if is_not_modified(request, etag, last_modified):
+        return _with_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+
+    return _with_validators(render(updated_at), etag, last_modified)
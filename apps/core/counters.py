@@ -0,0 +1,52 @@
+"""
+Materialized counters (core.Counter).
+
+Har counter ka ek key aur ek "source of truth" queryset hota hai. Live
+values DB triggers maintain karte hain (administrators / clients
+migrations); yahan sirf read aur reconciliation hai.
+"""
+from django.db import transaction
+
+from .models import Counter
+
+_registry = {}
+
+
+def register_counter(key, queryset):
+    """
+    `queryset` callable hai jo exact count ka queryset return kare
+    (reconcile ke waqt hi chalta hai).
+    """
+    _registry[key] = queryset
+
+
+def registered_counters():
+    return sorted(_registry)
+
+
+def read_counters(keys):
+    """
+    Ek query, missing row = 0.
+    """
+    values = dict(Counter.objects.filter(key__in=keys).values_list("key", "value"))
+    return {key: values.get(key, 0) for key in keys}
+
+
+def reconcile_counter(key):
+    """
+    Exact COUNT(*) se counter repair, (old, new) return karta hai.
+
+    Counter row pehle lock hoti hai: jo writers trigger se pehle row update
+    kar chuke woh commit ho chuke (count mein shamil), baaki lock par wait
+    karke apna delta hamare baad lagate hain, is liye beech mein drift
+    nahi aata.
+    """
+    with transaction.atomic():
+        Counter.objects.get_or_create(key=key)
+        counter = Counter.objects.select_for_update().get(key=key)
+        actual = _registry[key]().count()
+        previous = counter.value
+        if previous != actual:
+            counter.value = actual
+            counter.save(update_fields=["value", "updated_at"])
+    return previous, actual
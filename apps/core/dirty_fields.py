@@ -0,0 +1,86 @@
+"""
+Dirty-field tracking: DB se load hone ke baad jo fields badli hain, bare
+save() sirf unhein (aur auto_now columns) UPDATE karta hai.
+
+    user = ClientUser.objects.get(pk=1)
+    user.is_active = False
+    user.save()   # UPDATE client_users SET is_active, updated_at WHERE id = 1
+
+Explicit `update_fields` / force_insert / naye (adding) instances par
+Django ka normal save hi chalta hai.
+"""
+from django.db.models.fields.files import FieldFile
+
+
+class DirtyFieldsMixin:
+    """
+    Abstract base model se pehle mix karo: class X(DirtyFieldsMixin, models.Model).
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot()
+        return instance
+
+    def _tracked_value(self, field):
+        value = self.__dict__.get(field.attname)
+        # FieldFile in-place badalta hai (file.save()), is liye sirf naam compare
+        return value.name if isinstance(value, FieldFile) else value
+
+    def _snapshot(self, attnames=None):
+        # Deferred (only()) fields __dict__ mein nahi hote, snapshot mein bhi nahi
+        values = {
+            field.attname: self._tracked_value(field)
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__ and (attnames is None or field.attname in attnames)
+        }
+        # Naya dict (in-place update nahi): principal cache ki copy.copy instances
+        # snapshot share karti hain
+        if attnames is None:
+            self._loaded_values = values
+        else:
+            self._loaded_values = {**self.__dict__.get("_loaded_values", {}), **values}
+
+    def get_dirty_fields(self):
+        """
+        Load ke baad badli hui field names; untracked (kabhi load/save nahi hua)
+        instance par None.
+        """
+        loaded = self.__dict__.get("_loaded_values")
+        if loaded is None:
+            return None
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.attname in self.__dict__
+            and (field.attname not in loaded or loaded[field.attname] != self._tracked_value(field))
+        ]
+
+    def save(self, *args, **kwargs):
+        if not args and kwargs.get("update_fields") is None and not kwargs.get("force_insert") and not self._state.adding:
+            dirty = self.get_dirty_fields()
+            if dirty is not None:
+                auto_now = [
+                    field.name for field in self._meta.concrete_fields
+                    if getattr(field, "auto_now", False) and field.name not in dirty
+                ]
+                kwargs["update_fields"] = dirty + auto_now
+
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self._snapshot()
+        else:
+            self._snapshot({self._meta.get_field(name).attname for name in update_fields})
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        # Refresh ke baad DB values hi naya baseline hain
+        fields = kwargs.get("fields") or (args[1] if len(args) > 1 else None)
+        if fields is None:
+            self._snapshot()
+        else:
+            self._snapshot({self._meta.get_field(name).attname for name in fields})
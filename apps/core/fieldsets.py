@@ -0,0 +1,59 @@
+"""
+Sparse fieldsets: `?fields=id,email` / `?exclude=phone`.
+
+Har (serializer, field set) ke liye ek trimmed serializer subclass banta hai,
+is liye query planning (only()) aur compiled values_list path dono sirf
+chune hue columns select karte hain.
+"""
+import functools
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+# Field subsets 2^n ho sakte hain aur ?fields= caller ke haath mein hai,
+# is liye generated classes LRU se bounded hain
+SPARSE_CLASS_CACHE_SIZE = 256
+
+
+def _parse(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def sparse_serializer_class(serializer_class, request, fields_param="fields", exclude_param="exclude"):
+    if request is None or request.method not in SAFE_METHODS:
+        return serializer_class
+
+    fields = request.query_params.get(fields_param)
+    exclude = request.query_params.get(exclude_param)
+    if not fields and not exclude:
+        return serializer_class
+
+    readable = [
+        name for name, field in serializer_class().fields.items()
+        if not field.write_only
+    ]
+
+    errors = {}
+    requested = _parse(fields) if fields else readable
+    excluded = _parse(exclude) if exclude else []
+    for param, names in ((fields_param, requested), (exclude_param, excluded)):
+        unknown = sorted(set(names) - set(readable))
+        if unknown:
+            errors[param] = [f"Unknown field(s): {', '.join(unknown)}."]
+    if errors:
+        raise ValidationError(errors)
+
+    selected = tuple(name for name in readable if name in requested and name not in excluded)
+    if not selected:
+        raise ValidationError({fields_param: ["At least one field must be selected."]})
+    if len(selected) == len(readable):
+        return serializer_class
+
+    return _sparse_class(serializer_class, selected)
+
+
+@functools.lru_cache(maxsize=SPARSE_CLASS_CACHE_SIZE)
+def _sparse_class(serializer_class, selected):
+    # `selected` readable order mein canonical hai (?fields=b,a == ?fields=a,b)
+    meta = type("Meta", (serializer_class.Meta,), {"fields": selected})
+    return type(serializer_class.__name__, (serializer_class,), {"Meta": meta})
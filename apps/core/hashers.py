@@ -0,0 +1,55 @@
+"""
+Password hashers whose cost parameters come from settings.PASSWORD_HASHER_PARAMS
+(manage.py calibrate_password_hashers in values ko target host par nikalta hai).
+
+Algorithm names Django wale hi hain, is liye purane hashes verify hote rehte
+hain aur params badalne par login ke waqt must_update -> rehash ho jata hai.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+def _param(algorithm, name, default):
+    return getattr(settings, "PASSWORD_HASHER_PARAMS", {}).get(algorithm, {}).get(name, default)
+
+
+class CalibratedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return _param(self.algorithm, "iterations", PBKDF2PasswordHasher.iterations)
+
+
+class CalibratedScryptPasswordHasher(ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return _param(self.algorithm, "work_factor", ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return _param(self.algorithm, "block_size", ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return _param(self.algorithm, "parallelism", ScryptPasswordHasher.parallelism)
+
+    @property
+    def maxmem(self):
+        return _param(self.algorithm, "maxmem", ScryptPasswordHasher.maxmem)
+
+
+class CalibratedArgon2PasswordHasher(Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return _param(self.algorithm, "time_cost", Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _param(self.algorithm, "memory_cost", Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _param(self.algorithm, "parallelism", Argon2PasswordHasher.parallelism)
@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingServiceBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Server is busy, please retry shortly."
+    default_code = "hashing_service_busy"
+
+
+def _algorithm(encoded):
+    return encoded.split("$", 1)[0] if encoded and "$" in encoded else "unknown"
+
+
+def _verify_password(password, encoded):
+    """
+    Worker function: (matched, rehashed-or-None, elapsed seconds, algorithm).
+    Stored hash preferred hasher / calibrated params se purana ho to
+    Django ka setter naya hash bana deta hai.
+    """
+    rehashed = []
+    start = time.perf_counter()
+    matched = hashers.check_password(
+        password, encoded, setter=lambda raw: rehashed.append(hashers.make_password(raw))
+    )
+    elapsed = time.perf_counter() - start
+    return matched, (rehashed[0] if rehashed else None), elapsed, _algorithm(encoded)
+
+
+def _make_password(password):
+    start = time.perf_counter()
+    encoded = hashers.make_password(password)
+    return encoded, time.perf_counter() - start, _algorithm(encoded)
+
+
+class HashTimingMetrics:
+    """
+    Per (operation, algorithm) hash timings: count, total, max.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = {}
+        self.rehashes = 0
+
+    def observe(self, operation, algorithm, elapsed):
+        with self._lock:
+            count, total, longest = self._timings.get((operation, algorithm), (0, 0.0, 0.0))
+            self._timings[(operation, algorithm)] = (count + 1, total + elapsed, max(longest, elapsed))
+
+    def observe_rehash(self):
+        with self._lock:
+            self.rehashes += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "rehashes": self.rehashes,
+                "timings": [
+                    {
+                        "operation": operation,
+                        "algorithm": algorithm,
+                        "count": count,
+                        "avg_ms": round(total / count * 1000, 2),
+                        "max_ms": round(longest * 1000, 2),
+                    }
+                    for (operation, algorithm), (count, total, longest) in sorted(self._timings.items())
+                ],
+            }
+
+
+class PasswordHashingService:
+    """
+    Bounded executor for PBKDF2 (ya jo bhi hasher configured ho) calls.
+
+    Pending jobs `max_pending` se zyada hon to naya job queue nahi hota,
+    HashingServiceBusy (503) foran raise hota hai.
+    """
+
+    def __init__(self, executor="thread", max_workers=4, max_pending=32):
+        self.executor_type = executor
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.metrics = HashTimingMetrics()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._dummy_future = None
+        self._dummy_lock = threading.Lock()
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    if self.executor_type == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix="password-hashing",
+                        )
+        return self._executor
+
+    def submit(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HashingServiceBusy()
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _dummy_hash_future(self):
+        # Unknown identifier par bhi ek poora hash chalana hai (constant timing).
+        # Dummy hash ek hi baar executor par banta hai, event loop / request
+        # thread par kabhi nahi.
+        with self._dummy_lock:
+            future = self._dummy_future
+            if future is None or (future.done() and future.exception() is not None):
+                future = self._dummy_future = self._get_executor().submit(
+                    hashers.make_password, "timing-equaliser-password"
+                )
+            return future
+
+    def dummy_hash(self):
+        return self._dummy_hash_future().result()
+
+    async def adummy_hash(self):
+        return await asyncio.wrap_future(self._dummy_hash_future())
+
+    def _verified(self, result, dummy=False):
+        matched, rehashed, elapsed, algorithm = result
+        self.metrics.observe("verify", algorithm, elapsed)
+        if dummy:
+            return False, None
+        if matched and rehashed:
+            self.metrics.observe_rehash()
+        return matched, rehashed if matched else None
+
+    def _made(self, result):
+        encoded, elapsed, algorithm = result
+        self.metrics.observe("make", algorithm, elapsed)
+        return encoded
+
+    # --- sync API (WSGI views) ---
+
+    def verify(self, password, encoded):
+        """
+        (matched, rehashed) return karta hai. `rehashed` sirf tab milta hai jab
+        password sahi ho aur stored hash ko upgrade karna ho.
+        `encoded` None ho (principal nahi mila) to dummy hash verify hota hai.
+        """
+        if encoded is None:
+            return self._verified(self.submit(_verify_password, password, self.dummy_hash()).result(), dummy=True)
+        return self._verified(self.submit(_verify_password, password, encoded).result())
+
+    def check_password(self, password, encoded):
+        return self.verify(password, encoded)[0]
+
+    def make_password(self, password):
+        return self._made(self.submit(_make_password, password).result())
+
+    # --- async API (ASGI views) ---
+
+    async def averify(self, password, encoded):
+        if encoded is None:
+            result = await asyncio.wrap_future(self.submit(_verify_password, password, await self.adummy_hash()))
+            return self._verified(result, dummy=True)
+        return self._verified(await asyncio.wrap_future(self.submit(_verify_password, password, encoded)))
+
+    async def acheck_password(self, password, encoded):
+        return (await self.averify(password, encoded))[0]
+
+    async def amake_password(self, password):
+        return self._made(await asyncio.wrap_future(self.submit(_make_password, password)))
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            self._dummy_future = None
+
+
+def persist_rehash(instance, rehashed):
+    """
+    Successful login par upgraded hash sirf password_hash column mein likhte hain.
+    """
+    if rehashed:
+        type(instance).objects.filter(pk=instance.pk).update(password_hash=rehashed)
+        instance.password_hash = rehashed
+
+
+async def apersist_rehash(instance, rehashed):
+    if rehashed:
+        await type(instance).objects.filter(pk=instance.pk).aupdate(password_hash=rehashed)
+        instance.password_hash = rehashed
+
+
+_config = getattr(settings, "PASSWORD_HASHING", {})
+
+password_hashing = PasswordHashingService(
+    executor=_config.get("EXECUTOR", "thread"),
+    max_workers=_config.get("MAX_WORKERS", 4),
+    max_pending=_config.get("MAX_PENDING", 32),
+)
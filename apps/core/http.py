@@ -0,0 +1,28 @@
+import json
+
+from django.http import JsonResponse
+
+
+def parse_json_body(request):
+    """
+    Plain Django (async) views ke liye JSON body parse karta hai.
+    Invalid JSON par None return hota hai.
+    """
+    try:
+        data = json.loads(request.body or b"{}")
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def error_response(message, status):
+    return JsonResponse({"error": message}, status=status)
+
+
+def throttled_response(wait):
+    response = JsonResponse(
+        {"detail": f"Request was throttled. Expected available in {wait} seconds."},
+        status=429,
+    )
+    response["Retry-After"] = str(wait)
+    return response
@@ -0,0 +1,169 @@
+"""
+`Idempotency-Key` header support for expensive POST endpoints.
+
+    @idempotent("client-signup")
+    def post(self, request): ...
+
+Pehli request key "claim" karti hai (in-flight row), handler chalata hai
+aur response store karti hai. Usi key + same request ka replay stored
+response lautata hai (handler dobara nahi chalta, header
+`Idempotent-Replayed: true`); concurrent duplicate in-flight wali ke
+khatam hone ka wait karta hai. Key ka scope endpoint + principal hai.
+
+Handler transaction.atomic() mein nahi chalta: signup / admin create mein
+password hashing (sau-do sau ms) ke dauran transaction aur connection
+khule rehte. Tradeoff: handler commit ke baad aur result store hone se
+pehle worker crash ho to claim IN_FLIGHT_TIMEOUT ke baad abandoned maana
+jata hai aur retry handler dobara chalata hai; wahan endpoints ke apne
+uniqueness checks (email, ek request per client) duplicate rokte hain.
+"""
+import functools
+import hashlib
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+from .principal import get_principal
+
+HEADER = "Idempotency-Key"
+
+_config = getattr(settings, "IDEMPOTENCY", {})
+TTL = _config.get("TTL", 24 * 60 * 60)
+WAIT_TIMEOUT = _config.get("WAIT_TIMEOUT", 10)
+IN_FLIGHT_TIMEOUT = _config.get("IN_FLIGHT_TIMEOUT", 60)
+
+
+def _fingerprint(request):
+    # request.body padhne ke baad bhi DRF parser ke liye stream available rehti hai
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.path}\n".encode())
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def _scope(request, endpoint):
+    principal = get_principal(request)
+    if principal is None:
+        return endpoint
+    return f"{endpoint}:{principal.kind}:{principal.instance.pk}"
+
+
+def _claim(scope, key, fingerprint):
+    """
+    (record, created): naya in-flight row ya maujooda row (None agar beech
+    mein hat gaya). Expired ya abandoned (crashed worker) claim hata kar
+    dobara koshish.
+    """
+    for _ in range(3):
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    scope=scope, key=key, fingerprint=fingerprint,
+                    expires_at=now + timedelta(seconds=TTL),
+                )
+            return record, True
+        except IntegrityError:
+            pass
+
+        record = IdempotencyKey.objects.filter(scope=scope, key=key).first()
+        if record is None:
+            continue
+        if record.expires_at <= now:
+            IdempotencyKey.objects.filter(pk=record.pk, expires_at__lte=now).delete()
+            continue
+        if record.status_code is None and record.created_at <= now - timedelta(seconds=IN_FLIGHT_TIMEOUT):
+            IdempotencyKey.objects.filter(pk=record.pk, status_code__isnull=True).delete()
+            continue
+        return record, False
+    return IdempotencyKey.objects.filter(scope=scope, key=key).first(), False
+
+
+def _wait_for(record):
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    delay = 0.05
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+        record = IdempotencyKey.objects.filter(pk=record.pk).first()
+        if record is None or record.status_code is not None:
+            return record
+    return None
+
+
+def _replay(record):
+    response = Response(record.response_body, status=record.status_code)
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+def idempotent(endpoint):
+    """
+    View method decorator. Header na ho to handler normal chalta hai.
+    Sirf returned < 500 responses store hoti hain; exception (validation
+    error bhi) ya 5xx par claim hata di jati hai taake retry dobara chale.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            key = request.headers.get(HEADER)
+            if not key:
+                return handler(self, request, *args, **kwargs)
+            if len(key) > 255:
+                return Response({"error": f"{HEADER} must be at most 255 characters."}, status=status.HTTP_400_BAD_REQUEST)
+
+            scope = _scope(request, endpoint)
+            fingerprint = _fingerprint(request)
+            record, created = _claim(scope, key, fingerprint)
+
+            if not created:
+                if record is not None and record.fingerprint != fingerprint:
+                    return Response(
+                        {"error": f"{HEADER} was already used for a different request."},
+                        status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    )
+                if record is not None and record.status_code is None:
+                    record = _wait_for(record)
+                if record is None or record.status_code is None:
+                    return Response(
+                        {"error": f"A request with this {HEADER} is still in progress, retry shortly."},
+                        status=status.HTTP_409_CONFLICT,
+                    )
+                return _replay(record)
+
+            # Apna hi row (pk se): abandoned samajh kar kisi aur ka naya claim ho to usay na chhuen
+            claim = IdempotencyKey.objects.filter(pk=record.pk, status_code__isnull=True)
+            try:
+                response = handler(self, request, *args, **kwargs)
+            except BaseException:
+                claim.delete()
+                raise
+            if response.status_code < 500:
+                claim.update(status_code=response.status_code, response_body=response.data)
+            else:
+                claim.delete()
+            return response
+        return wrapper
+    return decorator
+
+
+def purge_expired(batch_size=5000):
+    """
+    Expired keys batches mein delete; deleted count return hota hai.
+    """
+    deleted = 0
+    while True:
+        ids = list(
+            IdempotencyKey.objects.filter(expires_at__lte=timezone.now())
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        deleted += IdempotencyKey.objects.filter(id__in=ids).delete()[0]
+    return deleted
@@ -0,0 +1,107 @@
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from .response_cache import bump_table_version
+
+logger = logging.getLogger(__name__)
+
+
+def _has_updated_at(model):
+    return any(f.name == "updated_at" for f in model._meta.concrete_fields)
+
+
+class LastSeenBuffer:
+    """
+    Write-behind buffer for last-login timestamps.
+
+    Login par sirf memory mein (model, pk) -> timestamp record hota hai;
+    background thread har `interval` seconds (ya `max_pending` bharne par)
+    har table ke liye ek bulk_update chalata hai. Process exit par bhi flush.
+    """
+
+    def __init__(self, interval=5, max_pending=10_000):
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._stopped = False
+
+    def record(self, model, pk, field, when=None):
+        when = when or timezone.now()
+        key = (model, field, pk)
+        with self._lock:
+            # Ek principal ke multiple logins ek hi update mein coalesce
+            previous = self._pending.get(key)
+            if previous is None or previous < when:
+                self._pending[key] = when
+            pending = len(self._pending)
+
+        self._ensure_thread()
+        if pending >= self.max_pending:
+            self._wakeup.set()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        # bulk_update auto_now nahi lagata; updated_at khud set karte hain
+        # taake profile ETag / Last-Modified last-seen change bhi pakden
+        now = timezone.now()
+        grouped = {}
+        for (model, field, pk), when in pending.items():
+            values = {field: when}
+            if _has_updated_at(model):
+                values["updated_at"] = now
+            grouped.setdefault((model, field), []).append(model(pk=pk, **values))
+
+        for (model, field), objs in grouped.items():
+            fields = [field, "updated_at"] if _has_updated_at(model) else [field]
+            try:
+                model.objects.bulk_update(objs, fields, batch_size=1000)
+                # bulk_update signals nahi bhejta
+                bump_table_version(model)
+            except Exception:
+                logger.exception("Failed to flush %s.%s last-seen timestamps", model.__name__, field)
+        return len(pending)
+
+    def _ensure_thread(self):
+        if self._thread is not None or self._stopped:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="last-seen-flush", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                # Is thread ke DB connections band, idle connection hold na ho
+                connections.close_all()
+
+    def shutdown(self):
+        self._stopped = True
+        self._wakeup.set()
+        self.flush()
+
+
+_config = getattr(settings, "LAST_SEEN_BUFFER", {})
+
+last_seen_buffer = LastSeenBuffer(
+    interval=_config.get("FLUSH_INTERVAL", 5),
+    max_pending=_config.get("MAX_PENDING", 10_000),
+)
+
+atexit.register(last_seen_buffer.shutdown)
@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .revocation import revoked_tokens
+
+
+class BaseLogoutAPIView(APIView):
+    """
+    Current access token aur (body mein diya gaya) refresh token dono
+    revoke karta hai. Subclass authentication / permission classes set karein.
+    """
+
+    def post(self, request):
+        revoked_tokens.revoke_token(request.auth)
+
+        refresh = request.data.get("refresh")
+        if refresh:
+            try:
+                revoked_tokens.revoke_token(RefreshToken(refresh))
+            except TokenError:
+                return Response({"error": "Invalid refresh token"}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"message": "Logged out successfully"})
@@ -0,0 +1,59 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.clients.models import ClientRequest, ClientUser
+from apps.clients.serializers import ClientRequestSerializer, ClientUserSerializer
+from apps.core import renderers
+
+TARGETS = {
+    "client_requests": (ClientRequest, ClientRequestSerializer),
+    "client_users": (ClientUser, ClientUserSerializer),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Stock JSONRenderer vs orjson vs MessagePack: encode time aur payload size, "
+        "saath mein decoded payload identical hone ka check (existing rows par)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("target", choices=sorted(TARGETS))
+        parser.add_argument("--limit", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        model, serializer_class = TARGETS[options["target"]]
+        queryset = model.objects.order_by("-created_at", "-pk")[:options["limit"]]
+        data = {"next": None, "results": serializer_class(list(queryset), many=True).data}
+        expected = json.loads(JSONRenderer().render(data))
+
+        candidates = [("stock json", JSONRenderer(), json.loads)]
+        if renderers.orjson is not None:
+            candidates.append(("orjson", renderers.FastJSONRenderer(), renderers.orjson.loads))
+        else:
+            self.stdout.write("orjson not installed, skipping")
+        if renderers.msgpack is not None:
+            candidates.append((
+                "msgpack",
+                renderers.MessagePackRenderer(),
+                lambda payload: renderers.msgpack.unpackb(payload, raw=False),
+            ))
+        else:
+            self.stdout.write("msgpack not installed, skipping")
+
+        self.stdout.write(f"{len(data['results'])} rows")
+        for label, renderer, decode in candidates:
+            payload = renderer.render(data)
+            if decode(payload) != expected:
+                raise CommandError(f"{label}: decoded payload differs from stock JSONRenderer")
+            best = min(self._time(renderer, data) for _ in range(options["repeat"]))
+            self.stdout.write(f"{label:10s} {best * 1000:9.1f} ms  {len(payload):12,d} bytes")
+
+    def _time(self, renderer, data):
+        start = time.perf_counter()
+        renderer.render(data)
+        return time.perf_counter() - start
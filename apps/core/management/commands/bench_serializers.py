@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.clients.models import ClientRequest, ClientUser
+from apps.clients.serializers import ClientRequestSerializer, ClientUserSerializer
+from apps.core.compiled_serializers import compile_serializer
+
+TARGETS = {
+    "client_requests": (ClientRequest, ClientRequestSerializer),
+    "client_users": (ClientUser, ClientUserSerializer),
+}
+
+
+class Command(BaseCommand):
+    help = "Rows/sec: stock DRF ModelSerializer vs compiled values_list read path (existing rows par)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("target", choices=sorted(TARGETS))
+        parser.add_argument("--limit", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        model, serializer_class = TARGETS[options["target"]]
+        compiled = compile_serializer(serializer_class)
+        if compiled is None:
+            raise CommandError(f"{serializer_class.__name__} is not compilable")
+
+        queryset = model.objects.order_by("-created_at", "-pk")[:options["limit"]]
+        renderer = JSONRenderer()
+
+        def stock():
+            return serializer_class(list(queryset), many=True).data
+
+        def fast():
+            return compiled.render(queryset.values_list(*compiled.columns))
+
+        stock_bytes = renderer.render(stock())
+        fast_bytes = renderer.render(fast())
+        if stock_bytes != fast_bytes:
+            raise CommandError("Compiled output differs from stock DRF output")
+        rows = len(queryset)
+        self.stdout.write(f"{rows} rows, {len(stock_bytes)} bytes, outputs byte-identical")
+
+        for label, fn in (("stock DRF", stock), ("compiled", fast)):
+            best = min(self._time(fn) for _ in range(options["repeat"]))
+            self.stdout.write(f"{label:10s} {best * 1000:9.1f} ms  {rows / best:12,.0f} rows/s")
+
+    def _time(self, fn):
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.core.token_cache import CachedTokenValidationMixin, VerifiedTokenCache
+
+
+class _CachedJWTAuthentication(CachedTokenValidationMixin, JWTAuthentication):
+    token_cache = VerifiedTokenCache(max_size=1024)
+
+
+class Command(BaseCommand):
+    help = "Microbenchmark: per-request token validation with and without the verified-token cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50_000)
+        parser.add_argument("--tokens", type=int, default=100, help="Distinct tokens in rotation")
+
+    def handle(self, *args, **options):
+        tokens = []
+        for i in range(options["tokens"]):
+            token = AccessToken()
+            token["admin_id"] = i + 1
+            token["role"] = "administrator"
+            token["token_version"] = 0
+            tokens.append(str(token).encode())
+
+        iterations = options["iterations"]
+        for label, authenticator in (
+            ("stock JWTAuthentication", JWTAuthentication()),
+            ("verified-token cache", _CachedJWTAuthentication()),
+        ):
+            start = time.perf_counter()
+            for n in range(iterations):
+                authenticator.get_validated_token(tokens[n % len(tokens)])
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f"{label:28s} {elapsed / iterations * 1_000_000:8.2f} us/request "
+                f"({iterations / elapsed:,.0f} req/s)"
+            )
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+from django.core.management.base import BaseCommand
+
+PASSWORD = "calibration-password-1234"
+HASHER_PATHS = {
+    "pbkdf2_sha256": "apps.core.hashers.CalibratedPBKDF2PasswordHasher",
+    "argon2": "apps.core.hashers.CalibratedArgon2PasswordHasher",
+    "scrypt": "apps.core.hashers.CalibratedScryptPasswordHasher",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark password hashers on this host and print PASSWORD_HASHER_PARAMS / "
+        "PASSWORD_HASHERS that fit the per-login latency budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--budget-ms", type=float,
+            default=getattr(settings, "PASSWORD_HASH_LATENCY_BUDGET_MS", 250),
+        )
+        parser.add_argument("--prefer", choices=sorted(HASHER_PATHS), default="argon2")
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        self.runs = options["runs"]
+        budget = options["budget_ms"] / 1000
+        params = {}
+
+        params["pbkdf2_sha256"] = self._calibrate_pbkdf2(budget)
+        scrypt = self._calibrate_scrypt(budget)
+        if scrypt:
+            params["scrypt"] = scrypt
+        argon2 = self._calibrate_argon2(budget)
+        if argon2:
+            params["argon2"] = argon2
+
+        preferred = options["prefer"] if options["prefer"] in params else "pbkdf2_sha256"
+        order = [preferred] + [algorithm for algorithm in HASHER_PATHS if algorithm != preferred]
+        hasher_paths = [HASHER_PATHS[algorithm] for algorithm in order]
+        hasher_paths.insert(1, "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher")
+
+        self.stdout.write("\n# --- paste into hrm/settings.py ---")
+        self.stdout.write(f"PASSWORD_HASH_LATENCY_BUDGET_MS = {options['budget_ms']:g}")
+        self.stdout.write("PASSWORD_HASHER_PARAMS = " + json.dumps(params, indent=4))
+        self.stdout.write("PASSWORD_HASHERS = " + json.dumps(hasher_paths, indent=4))
+
+    def _time(self, fn):
+        samples = []
+        for _ in range(self.runs):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples)
+
+    def _report(self, algorithm, params, elapsed):
+        self.stdout.write(f"{algorithm:14s} {json.dumps(params):60s} {elapsed * 1000:8.1f} ms")
+
+    def _calibrate_pbkdf2(self, budget):
+        hasher = PBKDF2PasswordHasher()
+        salt = hasher.salt()
+        iterations = 100_000
+        elapsed = self._time(lambda: hasher.encode(PASSWORD, salt, iterations))
+        # PBKDF2 cost iterations ke saath linear hai
+        iterations = max(100_000, int(iterations * budget / elapsed) // 10_000 * 10_000)
+        elapsed = self._time(lambda: hasher.encode(PASSWORD, salt, iterations))
+        self._report("pbkdf2_sha256", {"iterations": iterations}, elapsed)
+        return {"iterations": iterations}
+
+    def _calibrate_scrypt(self, budget):
+        block_size = ScryptPasswordHasher.block_size
+        parallelism = ScryptPasswordHasher.parallelism
+        salt = ScryptPasswordHasher().salt().encode()
+        best = None
+        work_factor = 2 ** 14
+        while work_factor <= 2 ** 20:
+            maxmem = 128 * work_factor * block_size * 2
+            try:
+                elapsed = self._time(lambda: hashlib.scrypt(
+                    PASSWORD.encode(), salt=salt, n=work_factor, r=block_size,
+                    p=parallelism, maxmem=maxmem, dklen=64,
+                ))
+            except (ValueError, MemoryError):
+                break
+            if elapsed > budget:
+                break
+            best = {"work_factor": work_factor, "block_size": block_size, "parallelism": parallelism, "maxmem": maxmem}
+            self._report("scrypt", best, elapsed)
+            work_factor *= 2
+        return best
+
+    def _calibrate_argon2(self, budget):
+        hasher = Argon2PasswordHasher()
+        try:
+            argon2 = hasher._load_library()
+        except ValueError:
+            self.stdout.write("argon2         skipped (argon2-cffi not installed)")
+            return None
+
+        best = None
+        memory_cost = hasher.memory_cost
+        parallelism = hasher.parallelism
+        for time_cost in range(1, 11):
+            elapsed = self._time(lambda: argon2.PasswordHasher(
+                time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism,
+            ).hash(PASSWORD))
+            if elapsed > budget:
+                break
+            best = {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism}
+            self._report("argon2", best, elapsed)
+        return best
+
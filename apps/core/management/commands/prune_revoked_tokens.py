@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.revocation import revoked_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired rows from revoked_tokens in batches (cron ke liye)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        deleted = revoked_tokens.prune(batch_size=options["batch_size"])
+        self.stdout.write(f"Pruned {deleted} expired revoked tokens.")
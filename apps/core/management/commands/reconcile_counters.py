@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.counters import reconcile_counter, registered_counters
+
+
+class Command(BaseCommand):
+    help = "Materialized counters ko exact COUNT(*) se repair karo (drift report ke saath)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("keys", nargs="*", help="Sirf yeh counters (default: sab)")
+
+    def handle(self, *args, **options):
+        known = registered_counters()
+        keys = options["keys"] or known
+        unknown = sorted(set(keys) - set(known))
+        if unknown:
+            raise CommandError(f"Unknown counter(s): {', '.join(unknown)}")
+
+        drifted = 0
+        for key in keys:
+            previous, actual = reconcile_counter(key)
+            if previous != actual:
+                drifted += 1
+                self.stdout.write(f"{key}: {previous} -> {actual}")
+        self.stdout.write(f"Reconciled {len(keys)} counters, {drifted} drifted.")
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.9 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Counter',
+            fields=[
+                ('key', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'counters',
+            },
+        ),
+        # Domain triggers yeh helper call karte hain (same transaction mein)
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION bump_counter(counter_key text, delta bigint) RETURNS void AS $$
+                BEGIN
+                    INSERT INTO counters (key, value, updated_at) VALUES (counter_key, delta, now())
+                    ON CONFLICT (key) DO UPDATE
+                        SET value = counters.value + EXCLUDED.value, updated_at = now();
+                END;
+                $$ LANGUAGE plpgsql;
+            """,
+            reverse_sql="DROP FUNCTION IF EXISTS bump_counter(text, bigint);",
+        ),
+    ]
@@ -0,0 +1,60 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class RevokedToken(models.Model):
+    """
+    Revoked JWT `jti` values. Rows token ke expiry ke baad prune ho jati hain
+    (revocation.revoked_tokens.prune / manage.py prune_revoked_tokens).
+    """
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    # Workers ka incremental sync isi column par range scan karta hai
+    revoked_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = "revoked_tokens"
+
+    def __str__(self):
+        return self.jti
+
+
+class Counter(models.Model):
+    """
+    Materialized counts (dashboard stats). Values Postgres triggers
+    maintain karte hain (bulk .update() bhi cover), drift
+    `manage.py reconcile_counters` repair karta hai.
+    """
+    key = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "counters"
+
+    def __str__(self):
+        return f"{self.key}={self.value}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    `Idempotency-Key` header ka stored result (apps.core.idempotency).
+    status_code NULL = request abhi chal rahi hai (in flight).
+    """
+    scope = models.CharField(max_length=150)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "idempotency_keys"
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "key"], name="idempotency_scope_key_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.key}"
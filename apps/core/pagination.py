@@ -0,0 +1,116 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque-cursor keyset pagination on (created_at DESC, id DESC).
+
+    Cursor pichhle page ki aakhri row ka (created_at, id) hai, is liye agla
+    page `WHERE (created_at, id) < cursor ORDER BY ... LIMIT n` se aata hai:
+    OFFSET scan nahi, aur naye inserts pages ko shift nahi karte.
+    Composite (created_at, id) index zaroori hai.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 200
+    invalid_cursor_message = "Invalid cursor"
+    values_rows = False
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def cursor_values(self, obj):
+        """
+        Row se (created_at, pk). paginate_values_list() wale rows mein yeh
+        aakhri do columns hain.
+        """
+        if self.values_rows:
+            return obj[-2], obj[-1]
+        return obj.created_at, obj.pk
+
+    def encode_cursor(self, obj):
+        created_at, pk = self.cursor_values(obj)
+        payload = json.dumps({"c": created_at.isoformat(), "i": pk}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return datetime.fromisoformat(payload["c"]), int(payload["i"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.values_rows = False
+        return self._paginate(queryset, request)
+
+    def paginate_values_list(self, queryset, request, view=None):
+        """
+        values_list() queryset jis ke aakhri do columns (created_at, pk) hon
+        (compiled read path, apps.core.compiled_serializers).
+        """
+        self.values_rows = True
+        return self._paginate(queryset, request)
+
+    def _paginate(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by("-created_at", "-pk")
+        names, defer = queryset.query.deferred_loading
+        if names and not defer:
+            # only() laga ho to cursor columns bhi load hon, warna per-row query
+            queryset = queryset.only(*names, "created_at", "pk")
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            created_at, pk = cursor
+            # created_at__lte index range ko bound karta hai, OR sirf tie-break ke liye
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk),
+                created_at__lte=created_at,
+            )
+
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,62 @@
+class Principal:
+    """
+    Request-scoped authenticated principal.
+
+    Authentication class isay ek dafa fill karti hai; permission classes
+    sirf isay parhti hain, DB par dobara nahi jaati.
+    """
+
+    ADMINISTRATOR = "administrator"
+    CLIENT = "client"
+    CLIENT_USER = "client_user"
+
+    def __init__(self, kind, instance, token):
+        self.kind = kind
+        self.instance = instance
+        self.id = instance.pk
+        self.token = token
+
+    @property
+    def is_administrator(self):
+        return self.kind == self.ADMINISTRATOR
+
+    @property
+    def is_client(self):
+        return self.kind == self.CLIENT
+
+    @property
+    def is_client_user(self):
+        return self.kind == self.CLIENT_USER
+
+    @property
+    def client_id(self):
+        """
+        Principal ki company (Client) ka id: owner ke liye khud, staff ke
+        liye uska client_id, administrator ke liye None.
+        """
+        if self.is_client:
+            return self.id
+        if self.is_client_user:
+            return self.instance.client_id
+        return None
+
+    def __repr__(self):
+        return f"<Principal {self.kind}:{self.id}>"
+
+
+def attach_principal(request, kind, instance, token):
+    request.principal = Principal(kind, instance, token)
+    return request.principal
+
+
+def get_principal(request):
+    return getattr(request, "principal", None)
+
+
+def check_token_version(instance, validated_token):
+    """
+    Token ka `token_version` claim principal ke current version se match
+    hona chahiye. Deactivation / password change version bump karte hain,
+    is liye purane tokens yahan reject ho jate hain.
+    """
+    return validated_token.get("token_version", 0) == instance.token_version
@@ -0,0 +1,115 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class PrincipalCache:
+    """
+    Process-local LRU + TTL cache for authenticated principals
+    (Administrator, Client, ClientUser), keyed by (principal type, id).
+
+    Entries are invalidated by post_save / post_delete signals, so the TTL
+    only bounds staleness across worker processes.
+
+    Miss par loader lock ke bahar chalta hai; us dauran invalidate() aa jaye
+    to key ki generation badal jati hai aur loaded (stale) instance store
+    nahi hota. Generations sirf in-flight loads wali keys ki rakhi jati hain.
+    """
+
+    def __init__(self, max_size=2048, ttl=60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, kind, pk, loader):
+        """
+        Return a copy of the cached principal, or call `loader()` and cache
+        its result. Exceptions raised by the loader (e.g. DoesNotExist) are
+        not cached.
+        """
+        key = (kind, int(pk))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                # Copy de rahe hain taake views ki mutation cache ko touch na kare
+                return copy.copy(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generations.get(key, 0)
+            self._inflight[key] = self._inflight.get(key, 0) + 1
+
+        try:
+            instance = loader()
+        except BaseException:
+            with self._lock:
+                self._finish_load(key)
+            raise
+
+        # Generation check aur store ek hi lock section mein (beech mein invalidate nahi)
+        with self._lock:
+            stale = self._generations.get(key, 0) != generation
+            self._finish_load(key)
+            if not stale:
+                self._entries[key] = (now + self.ttl, instance)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return copy.copy(instance)
+
+    def _finish_load(self, key):
+        # Lock ke andar call hota hai
+        remaining = self._inflight[key] - 1
+        if remaining:
+            self._inflight[key] = remaining
+        else:
+            del self._inflight[key]
+            self._generations.pop(key, None)
+
+    def invalidate(self, kind, pk):
+        key = (kind, int(pk))
+        with self._lock:
+            self._entries.pop(key, None)
+            if key in self._inflight:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for key in self._inflight:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_config = getattr(settings, "PRINCIPAL_CACHE", {})
+
+principal_cache = PrincipalCache(
+    max_size=_config.get("MAX_SIZE", 2048),
+    ttl=_config.get("TTL", 60),
+)
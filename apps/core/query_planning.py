@@ -0,0 +1,110 @@
+import functools
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+
+
+class QueryPlan:
+    def __init__(self):
+        self.select_related = set()
+        self.prefetch_related = set()
+        self.only = set()
+        # Koi field model column / relation par map na ho (SerializerMethodField,
+        # property, source="*") to only() apply nahi karte
+        self.can_restrict_columns = True
+
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(self.prefetch_related))
+        if self.can_restrict_columns and self.only:
+            queryset = queryset.only(*sorted(self.only))
+        return queryset
+
+
+def _plan_serializer(serializer, model, prefix, plan):
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.SerializerMethodField) or not field.source_attrs:
+            plan.can_restrict_columns = False
+            continue
+        _plan_field(field, field.source_attrs, model, prefix, plan)
+
+
+def _plan_field(field, attrs, model, prefix, plan):
+    current_model = model
+    path = prefix
+    for position, attr in enumerate(attrs):
+        try:
+            model_field = current_model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            plan.can_restrict_columns = False
+            return
+
+        lookup = f"{path}{attr}"
+        is_last = position == len(attrs) - 1
+
+        if not model_field.is_relation:
+            plan.only.add(lookup)
+            return
+
+        if model_field.many_to_many or model_field.one_to_many:
+            plan.prefetch_related.add(lookup)
+            if not model_field.concrete:
+                return
+            plan.only.add(lookup)
+            return
+
+        if is_last and isinstance(field, (PrimaryKeyRelatedField, ManyRelatedField)):
+            # Sirf FK column chahiye (role_id), join ki zaroorat nahi
+            if model_field.concrete:
+                plan.only.add(lookup)
+            else:
+                plan.select_related.add(lookup)
+            return
+
+        plan.select_related.add(lookup)
+        if is_last:
+            if isinstance(field, serializers.BaseSerializer):
+                _plan_serializer(field, model_field.related_model, f"{lookup}__", plan)
+            else:
+                # StringRelatedField / Hyperlinked: poora related object load
+                plan.only.add(lookup)
+            return
+
+        current_model = model_field.related_model
+        path = f"{lookup}__"
+
+
+@functools.lru_cache(maxsize=512)
+def plan_for_serializer(serializer_class):
+    """
+    Serializer class ke declared fields / `source` paths se QueryPlan
+    (ek dafa per class, phir cache se). Bounded: sparse fieldset classes
+    bhi yahan aati hain.
+    """
+    plan = QueryPlan()
+    plan.only.add("pk")
+    _plan_serializer(serializer_class(), serializer_class.Meta.model, "", plan)
+    return plan
+
+
+def optimize_queryset(queryset, serializer_class):
+    return plan_for_serializer(serializer_class).apply(queryset)
+
+
+class QueryPlanningMixin:
+    """
+    GenericAPIView / ViewSet ke liye: read requests par get_queryset() ko
+    serializer ke hisaab se select_related / prefetch_related / only() milta hai.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        return optimize_queryset(queryset, self.get_serializer_class())
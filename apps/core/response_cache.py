@@ -0,0 +1,127 @@
+"""
+Versioned response cache for read-heavy list endpoints.
+
+Key = (endpoint, host + sorted query params, principal scope, table versions).
+post_save / post_delete (aur bulk writes) sirf table version bump karte hain,
+purani keys khud unreachable ho jati hain: na key scan, na delete.
+Versions bhi isi cache mein hain, is liye multi-worker deployment mein
+ALIAS shared backend (Redis / Memcached) hona chahiye: LocMem par ek
+worker ka bump doosre workers tak nahi pohanchta. LocMem par TIMEOUT
+LOCAL_TIMEOUT tak chhota ho jata hai (staleness ki had) aur startup par
+system check warning deta hai (apps.core.checks).
+"""
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from rest_framework.response import Response
+
+_config = getattr(settings, "RESPONSE_CACHE", {})
+
+
+def _cache():
+    return caches[_config.get("ALIAS", "default")]
+
+
+def is_process_local(cache):
+    return isinstance(cache, LocMemCache)
+
+
+def _timeout(cache):
+    timeout = _config.get("TIMEOUT", 300)
+    if is_process_local(cache):
+        return min(timeout, _config.get("LOCAL_TIMEOUT", 5))
+    return timeout
+
+
+def _version_key(model):
+    return f"table-version:{model._meta.db_table}"
+
+
+def get_table_version(model):
+    cache = _cache()
+    version = cache.get(_version_key(model))
+    if version is None:
+        # Eviction ke baad purana version dobara na aaye, is liye time-based seed
+        version = int(time.time() * 1000)
+        cache.add(_version_key(model), version, timeout=None)
+        version = cache.get(_version_key(model), version)
+    return version
+
+
+def _bump(model):
+    cache = _cache()
+    try:
+        cache.incr(_version_key(model))
+    except ValueError:
+        cache.set(_version_key(model), int(time.time() * 1000), timeout=None)
+
+
+def bump_table_version(model):
+    """
+    Commit ke baad bump: transaction ke andar bump hota to doosra worker
+    naye version ke neeche purana (uncommitted se pehle ka) data cache kar
+    leta. Autocommit mein foran chalta hai.
+    """
+    transaction.on_commit(lambda: _bump(model))
+
+
+class ResponseCacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def snapshot(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+response_cache_stats = ResponseCacheStats()
+
+
+def _cache_key(request, endpoint, models, scope):
+    params = "&".join(
+        f"{key}={value}"
+        for key in sorted(request.query_params)
+        for value in request.query_params.getlist(key)
+    )
+    versions = ",".join(str(get_table_version(model)) for model in models)
+    digest = hashlib.blake2b(f"{request.get_host()}?{params}".encode(), digest_size=16).hexdigest()
+    return f"response:{endpoint}:{scope}:{versions}:{digest}"
+
+
+def cached_response(request, endpoint, models, build, scope="global"):
+    """
+    `build()` sirf miss par chalta hai; 200 response ka data cache hota hai.
+    `models` woh tables hain jin ka version key ka hissa hai.
+    """
+    key = _cache_key(request, endpoint, models, scope)
+    cache = _cache()
+
+    data = cache.get(key)
+    if data is not None:
+        response_cache_stats.record(hit=True)
+        return Response(data)
+
+    response_cache_stats.record(hit=False)
+    response = build()
+    if response.status_code == 200:
+        cache.set(key, response.data, timeout=_timeout(cache))
+    return response
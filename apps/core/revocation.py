@@ -0,0 +1,169 @@
+import hashlib
+import heapq
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import RevokedToken
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over jti strings. False positive possible,
+    false negative nahi, is liye "not revoked" path yahin khatam ho jata hai.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = max(capacity, 1)
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class RevokedTokenStore:
+    """
+    Process-local view of the revoked_tokens table.
+
+    Check path: Bloom filter -> (maybe) exact set. Dusre processes ki
+    revocations har `sync_interval` seconds mein `revoked_at >= last sync -
+    sync_overlap` query se aati hain, per-request DB hit nahi hota. Serial
+    id commit order mein nahi hoti (concurrent logouts), is liye id
+    watermark nahi; overlap window dobara scan hoti hai aur jti par dedupe
+    hota hai. Expired jti values ek min-heap (expiry ke hisaab se sorted)
+    se nikal kar prune hoti hain.
+    """
+
+    def __init__(self, capacity=100_000, sync_interval=5, sync_overlap=60):
+        self.capacity = capacity
+        self.sync_interval = sync_interval
+        self.sync_overlap = sync_overlap
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._bloom = BloomFilter(self.capacity)
+        self._revoked = set()
+        self._expiry_heap = []
+        self._synced_until = None
+        self._last_sync = 0.0
+
+    def _add_local(self, jti, expires_ts):
+        if jti in self._revoked:
+            return
+        self._revoked.add(jti)
+        heapq.heappush(self._expiry_heap, (expires_ts, jti))
+        if self._bloom.count >= self._bloom.capacity:
+            self._rebuild_bloom(capacity=self._bloom.capacity * 2)
+        else:
+            self._bloom.add(jti)
+
+    def _rebuild_bloom(self, capacity=None):
+        self._bloom = BloomFilter(max(capacity or self.capacity, len(self._revoked) * 2))
+        for jti in self._revoked:
+            self._bloom.add(jti)
+
+    def _expire_local(self, now_ts):
+        expired = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now_ts:
+            _, jti = heapq.heappop(self._expiry_heap)
+            self._revoked.discard(jti)
+            expired += 1
+        # Bloom se delete nahi ho sakta; aadhe se zyada stale ho to rebuild
+        if expired and self._bloom.count > 2 * max(len(self._revoked), 1):
+            self._rebuild_bloom()
+
+    def sync(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_sync < self.sync_interval:
+            return
+
+        with self._lock:
+            if not force and now - self._last_sync < self.sync_interval:
+                return
+            self._last_sync = now
+            since = self._synced_until
+
+        # DB query lock ke bahar: is_revoked() callers is dauran block nahi hote
+        started = timezone.now()
+        queryset = RevokedToken.objects.filter(expires_at__gt=started)
+        if since is not None:
+            # revoked_at insert se pehle set hota hai, commit baad mein: overlap
+            # window der se commit hone wali rows bhi pakad leti hai
+            queryset = queryset.filter(revoked_at__gte=since - timedelta(seconds=self.sync_overlap))
+        rows = list(queryset.values_list("jti", "expires_at"))
+
+        with self._lock:
+            for jti, expires_at in rows:
+                self._add_local(jti, expires_at.timestamp())
+            if self._synced_until is None or self._synced_until < started:
+                self._synced_until = started
+            self._expire_local(time.time())
+
+    def is_revoked(self, jti):
+        if not jti:
+            return False
+        self.sync()
+        if jti not in self._bloom:
+            return False
+        with self._lock:
+            return jti in self._revoked
+
+    def revoke(self, jti, exp):
+        """
+        `exp` token ka epoch-seconds claim hai.
+        """
+        expires_at = datetime.fromtimestamp(exp, tz=dt_timezone.utc)
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=jti, expires_at=expires_at)],
+            ignore_conflicts=True,
+        )
+        with self._lock:
+            self._add_local(jti, exp)
+
+    def revoke_token(self, token):
+        self.revoke(token[settings.SIMPLE_JWT.get("JTI_CLAIM", "jti")], token["exp"])
+
+    def prune(self, batch_size=5000):
+        """
+        Expired rows batches mein delete karta hai; deleted count return hota hai.
+        """
+        deleted = 0
+        while True:
+            ids = list(
+                RevokedToken.objects.filter(expires_at__lte=timezone.now())
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            deleted += RevokedToken.objects.filter(id__in=ids).delete()[0]
+        with self._lock:
+            self._expire_local(time.time())
+        return deleted
+
+
+_config = getattr(settings, "REVOKED_TOKENS", {})
+
+revoked_tokens = RevokedTokenStore(
+    capacity=_config.get("BLOOM_CAPACITY", 100_000),
+    sync_interval=_config.get("SYNC_INTERVAL", 5),
+    sync_overlap=_config.get("SYNC_OVERLAP", 60),
+)
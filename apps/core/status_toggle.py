@@ -0,0 +1,67 @@
+"""
+Single-statement is_active toggle:
+
+    UPDATE t SET is_active = NOT is_active | %s, token_version = ..., updated_at = %s
+    WHERE id IN (<scoped queryset>) RETURNING is_active
+
+Read-modify-write nahi, is liye do concurrent toggles ek doosre ko cancel
+nahi karte, aur explicit target (`{"is_active": false}`) ke saath retries
+idempotent hain. Scope caller ka queryset deta hai (tenant filter wahi
+rehta hai jo get_queryset() mein hai).
+"""
+from django.core.exceptions import ValidationError
+from django.db import connections, router
+from django.http import Http404
+from django.utils import timezone
+from rest_framework import serializers
+
+from .principal_cache import principal_cache
+from .response_cache import bump_table_version
+
+
+class StatusToggleSerializer(serializers.Serializer):
+    # Na diya jaye to flip, diya jaye to wahi state set
+    is_active = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+def set_active_state(queryset, pk, is_active=None, principal_kind=None):
+    """
+    Naya is_active return karta hai, ya None agar row scope mein nahi.
+    Active -> inactive par token_version bhi isi statement mein bump hota hai.
+    URL ka pk number na ho to Http404 (SQL banne se pehle).
+    """
+    model = queryset.model
+    try:
+        pk = int(model._meta.pk.to_python(pk))
+    except (TypeError, ValueError, ValidationError):
+        raise Http404
+    using = router.db_for_write(model)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    opts = model._meta
+    column = {name: quote(opts.get_field(name).column) for name in ("is_active", "token_version", "updated_at")}
+    pk_column = quote(opts.pk.column)
+
+    scope_sql, scope_params = queryset.filter(pk=pk).values("pk").query.sql_with_params()
+    new_state = f"NOT {column['is_active']}" if is_active is None else "%s"
+    new_params = [] if is_active is None else [is_active]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {quote(opts.db_table)} SET "
+            f"{column['is_active']} = {new_state}, "
+            f"{column['token_version']} = {column['token_version']} + "
+            f"CASE WHEN {column['is_active']} AND NOT ({new_state}) THEN 1 ELSE 0 END, "
+            f"{column['updated_at']} = %s "
+            f"WHERE {pk_column} IN ({scope_sql}) RETURNING {column['is_active']}",
+            [*new_params, *new_params, timezone.now(), *scope_params],
+        )
+        row = cursor.fetchone()
+
+    if row is None:
+        return None
+    # Raw UPDATE post_save nahi bhejta: jo signals karte woh yahan
+    if principal_kind:
+        principal_cache.invalidate(principal_kind, pk)
+    bump_table_version(model)
+    return row[0]
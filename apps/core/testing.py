@@ -0,0 +1,48 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .principal_cache import principal_cache
+from .revocation import revoked_tokens
+
+
+class ConstantQueryCountMixin:
+    """
+    TestCase mixin: list endpoint ki query count rows ki tadaad se
+    independent honi chahiye (N+1 pakadne ke liye).
+
+        def test_admin_list_queries(self):
+            self.assertConstantQueryCount(
+                make_rows=lambda n: Administrator.objects.bulk_create(
+                    [Administrator(username=f"a{i}", ...) for i in range(n)]
+                ),
+                call=lambda: self.client.get("/api/admin/management/"),
+            )
+
+    `make_rows(n)` ko n *naye* rows banane hain (sizes cumulative hain).
+    Har call se pehle process-local caches reset hote hain taake pehli aur
+    baad wali calls barabar queries chalayen.
+    """
+
+    def reset_query_count_caches(self):
+        principal_cache.clear()
+        # Revocation sync interval ke hisaab se kabhi kabhi query karta hai
+        revoked_tokens.sync(force=True)
+
+    def assertConstantQueryCount(self, make_rows, call, sizes=(1, 5, 25)):
+        counts = {}
+        created = 0
+        for size in sizes:
+            make_rows(size - created)
+            created = size
+            self.reset_query_count_caches()
+            with CaptureQueriesContext(connection) as context:
+                response = call()
+            # 401 / 403 bhi constant hote hain; asal list path hi napna hai
+            self.assertEqual(getattr(response, "status_code", 200), 200, getattr(response, "data", None))
+            counts[size] = len(context.captured_queries)
+
+        self.assertEqual(
+            len(set(counts.values())), 1,
+            f"Query count grows with row count: {counts}",
+        )
+        return counts
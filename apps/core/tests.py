@@ -0,0 +1,281 @@
+import io
+import itertools
+import json
+import re
+import threading
+import unittest
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from .checks import check_response_cache_alias
+from .exports import _csv_lines
+from .fieldsets import SPARSE_CLASS_CACHE_SIZE, _sparse_class
+from .models import RevokedToken
+from .principal_cache import PrincipalCache
+from .renderers import FastJSONParser, FastJSONRenderer, MessagePackParser, MessagePackRenderer, msgpack, orjson
+from .response_cache import _timeout as _response_timeout
+from .revocation import RevokedTokenStore
+from .throttling import LocalWindowBackend, LoginThrottle, SlidingWindowLimiter, get_client_ip
+
+
+class SlidingWindowLimiterTests(SimpleTestCase):
+    # Local backend shared-cache backend ka stand-in hai (same increment contract)
+
+    def test_limit_then_wait(self):
+        limiter = SlidingWindowLimiter(LocalWindowBackend(), limit=3, window=60)
+        now = 6000.0
+        self.assertEqual([limiter.hit("k", now) for _ in range(3)], [None, None, None])
+        self.assertEqual(limiter.hit("k", now), 60)
+
+    def test_previous_window_is_weighted(self):
+        limiter = SlidingWindowLimiter(LocalWindowBackend(), limit=4, window=60)
+        for _ in range(4):
+            limiter.hit("k", 6000.0)
+        # Agli window ka aadha: previous ka 50% (2) + naye attempts
+        self.assertIsNone(limiter.hit("k", 6090.0))
+        self.assertIsNone(limiter.hit("k", 6090.0))
+        self.assertIsNotNone(limiter.hit("k", 6090.0))
+
+    def test_concurrent_burst_does_not_exceed_limit(self):
+        limiter = SlidingWindowLimiter(LocalWindowBackend(), limit=10, window=60)
+        allowed = []
+        barrier = threading.Barrier(50)
+
+        def attempt():
+            barrier.wait()
+            if limiter.hit("burst", 6000.0) is None:
+                allowed.append(1)
+
+        threads = [threading.Thread(target=attempt) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(allowed), 10)
+
+
+class LoginThrottleTests(SimpleTestCase):
+    def test_identifier_limit_across_ips(self):
+        throttle = LoginThrottle(LocalWindowBackend(), window=60, ip_limit=100, identifier_limit=2)
+        self.assertIsNone(throttle.check("login", "10.0.0.1", "Owner@Example.com"))
+        self.assertIsNone(throttle.check("login", "10.0.0.2", "owner@example.com "))
+        self.assertIsNotNone(throttle.check("login", "10.0.0.3", "OWNER@example.com"))
+
+    def test_non_string_identifier_only_counts_ip(self):
+        throttle = LoginThrottle(LocalWindowBackend(), window=60, ip_limit=1, identifier_limit=1)
+        self.assertIsNone(throttle.check("login", "10.0.0.1", 123))
+        self.assertIsNotNone(throttle.check("login", "10.0.0.1", ["x"]))
+
+
+class ClientIPTests(SimpleTestCase):
+    def test_forwarded_for_ignored_without_trusted_proxies(self):
+        request = RequestFactory().post("/", REMOTE_ADDR="10.0.0.9", HTTP_X_FORWARDED_FOR="1.2.3.4")
+        self.assertEqual(get_client_ip(request), "10.0.0.9")
+
+    @override_settings(REST_FRAMEWORK={"NUM_PROXIES": 1})
+    def test_forwarded_for_used_with_trusted_proxy(self):
+        request = RequestFactory().post("/", REMOTE_ADDR="10.0.0.9", HTTP_X_FORWARDED_FOR="1.2.3.4")
+        self.assertEqual(get_client_ip(request), "1.2.3.4")
+
+
+class RevokedTokenSyncTests(TestCase):
+    def test_late_commit_with_older_revoked_at_is_picked_up(self):
+        store = RevokedTokenStore(capacity=100, sync_interval=0, sync_overlap=60)
+        expires_at = timezone.now() + timedelta(hours=1)
+        RevokedToken.objects.create(jti="first", expires_at=expires_at)
+        store.sync(force=True)
+        self.assertTrue(store.is_revoked("first"))
+
+        # Doosre worker ki row jo pehle (kam revoked_at) bani par baad mein commit hui
+        RevokedToken.objects.create(
+            jti="late", expires_at=expires_at, revoked_at=timezone.now() - timedelta(seconds=10)
+        )
+        store.sync(force=True)
+        self.assertTrue(store.is_revoked("late"))
+        self.assertFalse(store.is_revoked("never-revoked"))
+
+
+class CSVExportTests(SimpleTestCase):
+    def test_formula_cells_are_escaped(self):
+        values = ("=HYPERLINK(1)", "+1+cmd|' /C calc'!A0", "-2+3", "@SUM(A1)", "\tx", "\rx", "Acme")
+        rows = [{"name": value, "size": 5} for value in values]
+        lines = list(_csv_lines(["name", "size"], rows))
+        self.assertEqual(lines[0], "name,size\r\n")
+        self.assertEqual(
+            [line.split(",")[0] for line in lines[1:]],
+            ["'=HYPERLINK(1)", "'+1+cmd|' /C calc'!A0", "'-2+3", "'@SUM(A1)", "'\tx", "\"'\rx\"", "Acme"],
+        )
+        # Non-string values (numbers) unchanged
+        self.assertTrue(lines[1].endswith(",5\r\n"))
+
+    def test_phone_numbers_and_plain_numbers_unchanged(self):
+        values = ("+92 300 1234567", "+1 (555) 010-9999", "-12.5", "-")
+        rows = [{"phone": value} for value in values]
+        self.assertEqual(list(_csv_lines(["phone"], rows))[1:], [f"{value}\r\n" for value in values])
+
+
+class SparseFieldsetCacheTests(SimpleTestCase):
+    def test_generated_classes_are_bounded(self):
+        from apps.administrators.serializers import AdministratorSerializer
+
+        names = list(AdministratorSerializer().fields)
+        _sparse_class.cache_clear()
+        for size in (2, 3):
+            for selected in itertools.combinations(names, size):
+                _sparse_class(AdministratorSerializer, selected)
+        self.assertLessEqual(_sparse_class.cache_info().currsize, SPARSE_CLASS_CACHE_SIZE)
+        self.assertIs(
+            _sparse_class(AdministratorSerializer, ("id", "email")),
+            _sparse_class(AdministratorSerializer, ("id", "email")),
+        )
+
+
+RAW_VALUES = {
+    "aware": datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc),
+    "naive": datetime(2026, 1, 2, 3, 4, 5, 987654),
+    "whole_second": datetime(2026, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc),
+    "day": date(2026, 1, 2),
+    "at": time(9, 30, 15, 500001),
+    "amount": Decimal("10.50"),
+    "text": "line\u2028break",
+    "nested": [{"n": 1, "ok": True, "none": None}],
+}
+
+
+def _client_request_payload():
+    from apps.clients.models import Client, ClientRequest
+    from apps.clients.serializers import ClientRequestSerializer
+
+    client = Client.objects.create(company_name="Acme", company_email="acme@example.com", password_hash="!")
+    client_request = ClientRequest.objects.create(
+        client=client, company_phone="123", industry_type="IT", company_size="11-50"
+    )
+    return ClientRequestSerializer([client_request, client_request], many=True).data
+
+
+@unittest.skipIf(orjson is None, "orjson not installed")
+class FastJSONRendererTests(TestCase):
+    def test_raw_values_match_stock_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(RAW_VALUES), JSONRenderer().render(RAW_VALUES))
+
+    def test_serializer_data_matches_stock_renderer(self):
+        data = _client_request_payload()
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_oversized_int_falls_back(self):
+        data = {"big": 2 ** 70}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_parser_round_trip_and_error(self):
+        body = JSONRenderer().render(RAW_VALUES)
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), json.loads(body))
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b"{bad"))
+
+
+@unittest.skipIf(msgpack is None, "msgpack not installed")
+class MessagePackRendererTests(TestCase):
+    def _decoded(self, data):
+        return MessagePackParser().parse(io.BytesIO(MessagePackRenderer().render(data)))
+
+    def test_raw_values_match_stock_json(self):
+        expected = FastJSONParser().parse(io.BytesIO(JSONRenderer().render(RAW_VALUES)))
+        self.assertEqual(self._decoded(RAW_VALUES), expected)
+
+    def test_serializer_data_matches_stock_json(self):
+        data = _client_request_payload()
+        expected = FastJSONParser().parse(io.BytesIO(JSONRenderer().render(data)))
+        self.assertEqual(self._decoded(data), expected)
+
+    def test_malformed_payloads_are_parse_errors(self):
+        unhashable_key = b"\x81\x91\x01\x01"  # {[1]: 1}
+        for body in (b"\xc1", b"\x92\x01", unhashable_key, b"\x01\x02"):
+            with self.assertRaises(ParseError):
+                MessagePackParser().parse(io.BytesIO(body))
+
+
+class DirtyFieldsTests(TestCase):
+    def setUp(self):
+        from apps.administrators.models import Administrator
+
+        self.model = Administrator
+        self.admin = Administrator.objects.create(
+            username="dirty", email="dirty@example.com", password_hash="!", first_name="Old", last_name="Name",
+        )
+
+    def updated_columns(self, save):
+        with CaptureQueriesContext(connection) as ctx:
+            save()
+        updates = [query["sql"] for query in ctx.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1, updates)
+        set_clause = updates[0].split(" SET ", 1)[1].rsplit(" WHERE ", 1)[0]
+        return set(re.findall(r'"(\w+)" = ', set_clause))
+
+    def test_bare_save_writes_changed_field_and_updated_at(self):
+        admin = self.model.objects.get(pk=self.admin.pk)
+        admin.first_name = "New"
+        self.assertEqual(self.updated_columns(admin.save), {"first_name", "updated_at"})
+        self.assertEqual(admin.get_dirty_fields(), [])
+
+    def test_unchanged_save_only_touches_updated_at(self):
+        admin = self.model.objects.get(pk=self.admin.pk)
+        self.assertEqual(self.updated_columns(admin.save), {"updated_at"})
+
+    def test_deferred_fields_are_not_written(self):
+        admin = self.model.objects.only("id", "first_name").get(pk=self.admin.pk)
+        admin.first_name = "New"
+        self.assertEqual(self.updated_columns(admin.save), {"first_name", "updated_at"})
+        # Baad mein load hui deferred field bhi tracked hai
+        admin.last_name = "Changed"
+        self.assertEqual(self.updated_columns(admin.save), {"last_name", "updated_at"})
+
+    def test_refresh_from_db_resets_baseline(self):
+        admin = self.model.objects.get(pk=self.admin.pk)
+        self.model.objects.filter(pk=admin.pk).update(first_name="Elsewhere")
+        admin.last_name = "Local"
+        admin.refresh_from_db(fields=["first_name"])
+        self.assertEqual(admin.get_dirty_fields(), ["last_name"])
+        admin.refresh_from_db()
+        self.assertEqual(admin.get_dirty_fields(), [])
+        admin.designation = "Ops"
+        self.assertEqual(self.updated_columns(admin.save), {"designation", "updated_at"})
+
+    def test_principal_cache_copies_track_separately(self):
+        cache = PrincipalCache()
+        loader = lambda: self.model.objects.get(pk=self.admin.pk)
+        first = cache.get_or_load("administrator", self.admin.pk, loader)
+        second = cache.get_or_load("administrator", self.admin.pk, loader)
+        first.first_name = "New"
+        self.assertEqual(self.updated_columns(first.save), {"first_name", "updated_at"})
+        # Doosri copy ka baseline first ke save se nahi badla
+        self.assertEqual(second.get_dirty_fields(), [])
+        second.last_name = "Other"
+        self.assertEqual(self.updated_columns(second.save), {"last_name", "updated_at"})
+        self.assertEqual(
+            self.model.objects.filter(pk=self.admin.pk).values_list("first_name", "last_name").get(),
+            ("New", "Other"),
+        )
+
+
+class ResponseCacheBackendTests(SimpleTestCase):
+    def test_process_local_alias_caps_timeout(self):
+        self.assertEqual(_response_timeout(LocMemCache("t", {})), 5)
+
+    @override_settings(DEBUG=False)
+    def test_process_local_alias_warns_outside_debug(self):
+        self.assertEqual([w.id for w in check_response_cache_alias(None)], ["core.W001"])
+
+    @override_settings(
+        DEBUG=False,
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": "/tmp/hrm-cache"}},
+    )
+    def test_shared_alias_passes(self):
+        self.assertEqual(check_response_cache_alias(None), [])
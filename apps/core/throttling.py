@@ -0,0 +1,188 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+class LocalWindowBackend:
+    """
+    In-process sliding-window counters. Har key ke liye sirf
+    (window index, current count, previous count) rakhte hain aur keys ki
+    tadaad `max_keys` par LRU se bounded hai.
+    """
+
+    def __init__(self, max_keys=100_000):
+        self.max_keys = max_keys
+        self._counters = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _read(self, key, window_index):
+        entry = self._counters.get(key)
+        if entry is None:
+            return 0, 0
+        index, current, previous = entry
+        if index == window_index:
+            return current, previous
+        if index == window_index - 1:
+            return 0, current
+        return 0, 0
+
+    def increment(self, key, window_index, window):
+        """
+        Atomic record-and-read: (current count including this hit, previous).
+        """
+        with self._lock:
+            current, previous = self._read(key, window_index)
+            self._counters[key] = (window_index, current + 1, previous)
+            self._counters.move_to_end(key)
+            while len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+            return current + 1, previous
+
+
+class CacheWindowBackend:
+    """
+    Shared-cache sliding-window counters (Redis / Memcached / LocMem).
+    Har window ki apni key hai jo 2 windows baad khud expire ho jati hai.
+    """
+
+    def __init__(self, alias="default", prefix="login-throttle"):
+        self.alias = alias
+        self.prefix = prefix
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _key(self, key, window_index):
+        return f"{self.prefix}:{key}:{window_index}"
+
+    def increment(self, key, window_index, window):
+        """
+        (current count including this hit, previous). add() / incr() ki
+        return value hi compare hoti hai, is liye workers ke beech bhi
+        ek window mein limit se zyada attempts pass nahi hote.
+        """
+        cache_key = self._key(key, window_index)
+        if self.cache.add(cache_key, 1, timeout=window * 2):
+            current = 1
+        else:
+            try:
+                current = self.cache.incr(cache_key)
+            except ValueError:
+                # add() aur incr() ke beech key expire ho gayi
+                self.cache.add(cache_key, 0, timeout=window * 2)
+                current = self.cache.incr(cache_key)
+        return current, self.cache.get(self._key(key, window_index - 1), 0)
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window approximation: previous window ka weighted hissa +
+    current window count. Har check O(1) hai.
+    """
+
+    def __init__(self, backend, limit, window):
+        self.backend = backend
+        self.limit = limit
+        self.window = window
+
+    def _position(self, now):
+        window_index = int(now // self.window)
+        elapsed = (now % self.window) / self.window
+        return window_index, elapsed
+
+    def hit(self, key, now=None):
+        """
+        Attempt pehle record hota hai, phir atomic count compare: limit cross
+        ho to seconds (wait), warna None. Check-then-act nahi, is liye
+        concurrent burst bhi limit par ruk jata hai.
+        """
+        now = time.time() if now is None else now
+        window_index, elapsed = self._position(now)
+        current, previous = self.backend.increment(key, window_index, self.window)
+        if previous * (1 - elapsed) + current <= self.limit:
+            return None
+        return max(1, math.ceil(self.window * (1 - elapsed)))
+
+
+class LoginThrottle:
+    """
+    Per-IP aur per-identifier limits ek saath. Har attempt dono counters
+    mein record hota hai (rejected bhi, taake hammering block window ko
+    lamba kare); reject hone wali request hashing / DB tak nahi pohanchti.
+    """
+
+    def __init__(self, backend, window, ip_limit, identifier_limit):
+        self.ip_limiter = SlidingWindowLimiter(backend, ip_limit, window)
+        self.identifier_limiter = SlidingWindowLimiter(backend, identifier_limit, window)
+
+    def check(self, scope, ip, identifier=None):
+        now = time.time()
+        ip_key = f"{scope}:ip:{ip}"
+        if isinstance(identifier, str) and identifier.strip():
+            identifier_key = f"{scope}:id:{identifier.strip().lower()}"
+        else:
+            identifier_key = None
+
+        wait = self.ip_limiter.hit(ip_key, now)
+        if identifier_key:
+            identifier_wait = self.identifier_limiter.hit(identifier_key, now)
+            if identifier_wait is not None:
+                wait = max(wait or 0, identifier_wait)
+        return wait
+
+
+def _build_login_throttle():
+    config = getattr(settings, "LOGIN_THROTTLE", {})
+    if config.get("BACKEND", "local") == "cache":
+        backend = CacheWindowBackend(alias=config.get("CACHE_ALIAS", "default"))
+    else:
+        backend = LocalWindowBackend(max_keys=config.get("MAX_KEYS", 100_000))
+
+    return LoginThrottle(
+        backend,
+        window=config.get("WINDOW", 300),
+        ip_limit=config.get("IP_LIMIT", 50),
+        identifier_limit=config.get("IDENTIFIER_LIMIT", 10),
+    )
+
+
+login_throttle = _build_login_throttle()
+
+
+def get_client_ip(request):
+    """
+    REMOTE_ADDR, jab tak REST_FRAMEWORK["NUM_PROXIES"] (trusted proxies ki
+    ginti) set na ho. DRF ka get_ident NUM_PROXIES ke baghair client ka
+    bheja hua X-Forwarded-For maan leta hai, jise ghuma kar per-IP limit
+    bypass hoti.
+    """
+    if api_settings.NUM_PROXIES:
+        return BaseThrottle().get_ident(request)
+    return request.META.get("REMOTE_ADDR", "")
+
+
+class LoginRateThrottle(BaseThrottle):
+    """
+    DRF throttle for login views. View par `login_identifier_field` set karein
+    (e.g. "email_or_username") taake per-identifier limit bhi lage.
+    """
+
+    def allow_request(self, request, view):
+        field = getattr(view, "login_identifier_field", None)
+        identifier = request.data.get(field) if field else None
+        if not isinstance(identifier, str):
+            identifier = None
+
+        scope = getattr(view, "login_throttle_scope", view.__class__.__name__)
+        self._wait = login_throttle.check(scope, get_client_ip(request), identifier)
+        return self._wait is None
+
+    def wait(self):
+        return self._wait
@@ -0,0 +1,103 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .revocation import revoked_tokens
+
+
+class VerifiedTokenCache:
+    """
+    Bounded cache of already-validated access tokens.
+
+    Key raw token ka digest hai (token khud memory mein nahi rakhte) aur
+    entry token ke `exp` par expire hoti hai. Hit par decode + HMAC verify
+    dono skip ho jate hain.
+    """
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(raw_token):
+        if isinstance(raw_token, str):
+            raw_token = raw_token.encode()
+        return hashlib.blake2b(raw_token, digest_size=20).digest()
+
+    def get(self, raw_token):
+        key = self.digest(raw_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, validated_token = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return validated_token
+
+    def set(self, raw_token, validated_token):
+        expires_at = validated_token.get("exp")
+        if not expires_at:
+            return
+        key = self.digest(raw_token)
+        with self._lock:
+            self._entries[key] = (expires_at, validated_token)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+verified_token_cache = VerifiedTokenCache(
+    max_size=getattr(settings, "VERIFIED_TOKEN_CACHE_SIZE", 4096),
+)
+
+
+class CachedTokenValidationMixin:
+    """
+    JWTAuthentication subclasses ke liye: get_validated_token ko
+    verified_token_cache ke peeche rakhta hai. Revocation (jti) check
+    cache hit par bhi hota hai.
+    """
+
+    token_cache = verified_token_cache
+
+    def get_validated_token(self, raw_token):
+        validated_token = self.token_cache.get(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            self.token_cache.set(raw_token, validated_token)
+
+        if revoked_tokens.is_revoked(validated_token.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken("Token has been revoked")
+
+        return validated_token
@@ -3,6 +3,10 @@ ASGI config for hrm project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Login / signup endpoints have native async variants (``*/login/async/``,
+``client/signup/async/``) that await password hashing on the bounded
+PasswordHashingService pool, so a slow hash never holds the event loop.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
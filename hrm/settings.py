@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import timedelta
 
@@ -38,10 +39,12 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'rest_framework',
     'corsheaders',
     'rest_framework_simplejwt',
+    'apps.core',
     'apps.administrators',
     'apps.clients',
     'apps.candidates',
@@ -115,6 +118,34 @@ DATABASES = {
 
 
 
+# Cache
+# Production mein shared backend use karein, e.g.
+# 'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:6379'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
+# Password hashing
+# Cost params `manage.py calibrate_password_hashers` se is host ke liye nikalein
+
+PASSWORD_HASHERS = [
+    'apps.core.hashers.CalibratedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'apps.core.hashers.CalibratedArgon2PasswordHasher',
+    'apps.core.hashers.CalibratedScryptPasswordHasher',
+]
+
+PASSWORD_HASH_LATENCY_BUDGET_MS = 250
+
+PASSWORD_HASHER_PARAMS = {
+    # 'pbkdf2_sha256': {'iterations': 1_000_000},
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -166,6 +197,19 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Accept / Content-Type se negotiate: application/json (orjson) ya
+    # application/msgpack (msgpack install ho to)
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.FastJSONRenderer',
+        *(['apps.core.renderers.MessagePackRenderer'] if find_spec('msgpack') else []),
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'apps.core.renderers.FastJSONParser',
+        *(['apps.core.renderers.MessagePackParser'] if find_spec('msgpack') else []),
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 
@@ -200,3 +244,75 @@ SIMPLE_JWT = {
     # Custom token serializer to add admin_id
     'TOKEN_OBTAIN_SERIALIZER': 'apps.administrators.serializers.CustomTokenObtainPairSerializer',
 }
+
+
+# Process-local cache for authenticated principals (Administrator, Client, ClientUser)
+PRINCIPAL_CACHE = {
+    'MAX_SIZE': 2048,
+    'TTL': 60,  # seconds
+}
+
+# Already-verified access tokens (apps.core.token_cache), entries expire at token `exp`
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+
+
+# Off-thread password hashing (apps.core.hashing)
+PASSWORD_HASHING = {
+    'EXECUTOR': 'thread',  # 'thread' or 'process'
+    'MAX_WORKERS': 4,
+    'MAX_PENDING': 32,  # is se zyada pending hashes par 503
+}
+
+
+# Bulk client-user import (apps.clients.bulk_import)
+CLIENT_USER_IMPORT = {
+    'MAX_ROWS': 10000,  # per file
+    'CHUNK_SIZE': 1000,  # bulk_create batch
+    'MAX_WORKERS': None,  # hashing process pool (None = CPU count)
+}
+
+
+# Sliding-window login throttling (apps.core.throttling)
+LOGIN_THROTTLE = {
+    'BACKEND': 'local',  # 'local' (in-process) or 'cache' (shared Django cache)
+    'CACHE_ALIAS': 'default',
+    'WINDOW': 300,  # seconds
+    'IP_LIMIT': 50,
+    'IDENTIFIER_LIMIT': 10,
+    'MAX_KEYS': 100_000,  # local backend memory bound
+}
+
+
+# Write-behind last-login timestamps (apps.core.last_seen)
+LAST_SEEN_BUFFER = {
+    'FLUSH_INTERVAL': 5,  # seconds
+    'MAX_PENDING': 10_000,  # is se zyada pending par foran flush
+}
+
+
+# Revoked JWT jti store (apps.core.revocation)
+REVOKED_TOKENS = {
+    'BLOOM_CAPACITY': 100_000,
+    'SYNC_INTERVAL': 5,  # seconds, dusre workers ki revocations pick karne ke liye
+    'SYNC_OVERLAP': 60,  # seconds, har sync itna peeche se dobara scan (late commits)
+}
+
+
+# Idempotency-Key header (apps.core.idempotency); expired rows:
+# manage.py prune_idempotency_keys
+IDEMPOTENCY = {
+    'TTL': 24 * 60 * 60,  # seconds, stored response kitni der replay ho
+    'WAIT_TIMEOUT': 10,  # concurrent duplicate in-flight ka itna wait kare, phir 409
+    'IN_FLIGHT_TIMEOUT': 60,  # is se purana in-flight claim abandoned (crashed worker)
+}
+
+
+# Versioned response cache for admin list endpoints (apps.core.response_cache)
+# Table versions bhi ALIAS mein rehti hain: multiple workers ho to ALIAS shared
+# (Redis / Memcached) hona chahiye, warna ek worker ka bump baaki workers tak
+# nahi pohanchta. LocMem par TIMEOUT ki jagah LOCAL_TIMEOUT lagta hai.
+RESPONSE_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 300,  # seconds; invalidation table-version bump se hoti hai
+    'LOCAL_TIMEOUT': 5,  # seconds; process-local (LocMem) ALIAS par staleness ki had
+}